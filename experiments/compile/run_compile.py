@@ -0,0 +1,87 @@
+import os
+os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
+
+import argparse
+import time
+
+import pandas as pd
+import pytorch_lightning as pl
+
+from neuralforecast.core import NeuralForecast
+from neuralforecast.models import NHITS, PatchTST, TFT, LSTM, StemGNN
+from neuralforecast.utils import generate_series
+
+import logging
+logging.getLogger("pytorch_lightning").setLevel(logging.WARNING)
+
+
+class StepTimer(pl.Callback):
+    """Training steps per second after `warmup` steps (compilation happens in the warmup)."""
+    def __init__(self, warmup):
+        self.warmup = warmup
+        self.start = None
+        self.steps = 0
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+        if trainer.global_step == self.warmup:
+            self.start = time.perf_counter()
+            self.steps = 0
+        elif self.start is not None:
+            self.steps += 1
+
+    @property
+    def steps_per_sec(self):
+        return self.steps / (time.perf_counter() - self.start)
+
+
+def get_model(name, h, input_size, n_series, **kwargs):
+    if name == 'NHITS':
+        return NHITS(h=h, input_size=input_size, **kwargs)
+    if name == 'PatchTST':
+        return PatchTST(h=h, input_size=input_size, **kwargs)
+    if name == 'TFT':
+        return TFT(h=h, input_size=input_size, hidden_size=64, **kwargs)
+    if name == 'LSTM':
+        return LSTM(h=h, input_size=input_size, **kwargs)
+    if name == 'StemGNN':
+        return StemGNN(h=h, input_size=input_size, n_series=n_series, **kwargs)
+    raise ValueError(f'Unknown model {name}')
+
+
+if __name__ == '__main__':
+
+    # Parse execution parameters
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-models", "--models", nargs='+', default=['NHITS', 'PatchTST', 'TFT', 'LSTM', 'StemGNN'])
+    parser.add_argument("-n_series", "--n_series", default=8, type=int)
+    parser.add_argument("-horizon", "--horizon", default=24, type=int)
+    parser.add_argument("-max_steps", "--max_steps", default=60, type=int)
+    parser.add_argument("-warmup", "--warmup", default=10, type=int)
+
+    args = parser.parse_args()
+    h = args.horizon
+    input_size = 4 * h
+
+    Y_df = generate_series(n_series=args.n_series, min_length=1_000, max_length=1_000,
+                           equal_ends=True).reset_index()
+
+    results = []
+    for name in args.models:
+        row = {'model': name}
+        for compile in [False, True]:
+            timer = StepTimer(warmup=args.warmup)
+            model = get_model(name, h=h, input_size=input_size, n_series=args.n_series,
+                              max_steps=args.max_steps, val_check_steps=args.max_steps,
+                              compile=compile, callbacks=[timer])
+            nf = NeuralForecast(models=[model], freq='D')
+            nf.fit(df=Y_df)
+            # NeuralForecast fits copies of the models (and their callbacks)
+            timer = nf.models[0].trainer_kwargs['callbacks'][0]
+            row['compile' if compile else 'eager'] = timer.steps_per_sec
+        row['speedup'] = row['compile'] / row['eager']
+        results.append(row)
+
+    results = pd.DataFrame(results)
+    print('\n'*4)
+    print('Training steps/sec')
+    print(results.to_string(index=False, float_format='%.2f'))
@@ -60,20 +60,28 @@ d = { 'settings': { 'branch': 'main',
             'neuralforecast.core': { 'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.__init__': ( 'core.html#neuralforecast.__init__',
                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._check_futr_df': ( 'core.html#neuralforecast._check_futr_df',
+                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.append': ( 'core.html#neuralforecast.append',
+                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.cross_validation': ( 'core.html#neuralforecast.cross_validation',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.ds': ('core.html#neuralforecast.ds', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.fit': ('core.html#neuralforecast.fit', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.load': ('core.html#neuralforecast.load', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict': ( 'core.html#neuralforecast.predict',
                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict_insample': ( 'core.html#neuralforecast.predict_insample',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_last': ( 'core.html#neuralforecast.predict_last',
+                                                                                          'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
                                      'neuralforecast.core._cv_dates': ('core.html#_cv_dates', 'neuralforecast/core.py'),
                                      'neuralforecast.core._future_dates': ('core.html#_future_dates', 'neuralforecast/core.py'),
-                                     'neuralforecast.core._insample_dates': ('core.html#_insample_dates', 'neuralforecast/core.py')},
+                                     'neuralforecast.core._insample_dates': ('core.html#_insample_dates', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._load_ds': ('core.html#_load_ds', 'neuralforecast/core.py')},
             'neuralforecast.losses.numpy': { 'neuralforecast.losses.numpy._divide_no_nan': ( 'losses.numpy.html#_divide_no_nan',
                                                                                              'neuralforecast/losses/numpy.py'),
                                              'neuralforecast.losses.numpy._metric_protections': ( 'losses.numpy.html#_metric_protections',
@@ -897,6 +905,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.__init__': ( 'tsdataset.html#timeseriesdatamodule.__init__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._resident_loader': ( 'tsdataset.html#timeseriesdatamodule._resident_loader',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._train_loader': ( 'tsdataset.html#timeseriesdatamodule._train_loader',
+                                                                                                           'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.predict_dataloader': ( 'tsdataset.html#timeseriesdatamodule.predict_dataloader',
                                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.train_dataloader': ( 'tsdataset.html#timeseriesdatamodule.train_dataloader',
@@ -909,14 +921,42 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__getitem__': ( 'tsdataset.html#timeseriesdataset.__getitem__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getitems__': ( 'tsdataset.html#timeseriesdataset.__getitems__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getstate__': ( 'tsdataset.html#timeseriesdataset.__getstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__init__': ( 'tsdataset.html#timeseriesdataset.__init__',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__len__': ( 'tsdataset.html#timeseriesdataset.__len__',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__repr__': ( 'tsdataset.html#timeseriesdataset.__repr__',
                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__setstate__': ( 'tsdataset.html#timeseriesdataset.__setstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._layout': ( 'tsdataset.html#timeseriesdataset._layout',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._reserve': ( 'tsdataset.html#timeseriesdataset._reserve',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.from_arrow': ( 'tsdataset.html#timeseriesdataset.from_arrow',
+                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.from_df': ( 'tsdataset.html#timeseriesdataset.from_df',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.from_polars': ( 'tsdataset.html#timeseriesdataset.from_polars',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.indptr': ( 'tsdataset.html#timeseriesdataset.indptr',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.last_windows': ( 'tsdataset.html#timeseriesdataset.last_windows',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.load': ( 'tsdataset.html#timeseriesdataset.load',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.save': ( 'tsdataset.html#timeseriesdataset.save',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.share_memory': ( 'tsdataset.html#timeseriesdataset.share_memory',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.temporal': ( 'tsdataset.html#timeseriesdataset.temporal',
+                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.trim_dataset': ( 'tsdataset.html#timeseriesdataset.trim_dataset',
                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.update_dataset': ( 'tsdataset.html#timeseriesdataset.update_dataset',
@@ -926,7 +966,63 @@ d = { 'settings': { 'branch': 'main',
                                           'neuralforecast.tsdataset.TimeSeriesLoader.__init__': ( 'tsdataset.html#timeseriesloader.__init__',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader._collate_fn': ( 'tsdataset.html#timeseriesloader._collate_fn',
-                                                                                                     'neuralforecast/tsdataset.py')},
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader._pad_collate': ( 'tsdataset.html#timeseriesloader._pad_collate',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesStreamDataset': ( 'tsdataset.html#timeseriesstreamdataset',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesStreamDataset.__init__': ( 'tsdataset.html#timeseriesstreamdataset.__init__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesStreamDataset.__iter__': ( 'tsdataset.html#timeseriesstreamdataset.__iter__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesStreamDataset._read': ( 'tsdataset.html#timeseriesstreamdataset._read',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._BucketBatchSampler': ( 'tsdataset.html#_bucketbatchsampler',
+                                                                                            'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._BucketBatchSampler.__init__': ( 'tsdataset.html#_bucketbatchsampler.__init__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._BucketBatchSampler.__iter__': ( 'tsdataset.html#_bucketbatchsampler.__iter__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._BucketBatchSampler.__len__': ( 'tsdataset.html#_bucketbatchsampler.__len__',
+                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchLoader': ( 'tsdataset.html#_prefetchloader',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchLoader.__init__': ( 'tsdataset.html#_prefetchloader.__init__',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchLoader.__iter__': ( 'tsdataset.html#_prefetchloader.__iter__',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchLoader.__len__': ( 'tsdataset.html#_prefetchloader.__len__',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ResidentLoader': ( 'tsdataset.html#_residentloader',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ResidentLoader.__init__': ( 'tsdataset.html#_residentloader.__init__',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ResidentLoader.__iter__': ( 'tsdataset.html#_residentloader.__iter__',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ResidentLoader.__len__': ( 'tsdataset.html#_residentloader.__len__',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SharedTensor': ( 'tsdataset.html#_sharedtensor',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SharedTensor.__getstate__': ( 'tsdataset.html#_sharedtensor.__getstate__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SharedTensor.__init__': ( 'tsdataset.html#_sharedtensor.__init__',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SharedTensor.__setstate__': ( 'tsdataset.html#_sharedtensor.__setstate__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SharedTensor._map': ( 'tsdataset.html#_sharedtensor._map',
+                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SharedTensor._remove': ( 'tsdataset.html#_sharedtensor._remove',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._WindowLoader': ( 'tsdataset.html#_windowloader',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._WindowLoader.__init__': ( 'tsdataset.html#_windowloader.__init__',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._WindowLoader.__iter__': ( 'tsdataset.html#_windowloader.__iter__',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._WindowLoader.__len__': ( 'tsdataset.html#_windowloader.__len__',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._WindowLoader._gather': ( 'tsdataset.html#_windowloader._gather',
+                                                                                              'neuralforecast/tsdataset.py')},
             'neuralforecast.utils': { 'neuralforecast.utils.DayOfMonth': ('utils.html#dayofmonth', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.DayOfMonth.__call__': ( 'utils.html#dayofmonth.__call__',
                                                                                     'neuralforecast/utils.py'),
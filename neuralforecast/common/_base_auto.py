@@ -266,6 +266,16 @@ class BaseAuto(pl.LightningModule):
         """
         return self.model.predict(dataset=dataset, step_size=step_size, **data_kwargs)
 
+    def predict_last(self, dataset, futr_temporal=None, **kwargs):
+        """BaseAuto.predict_last
+
+        Predictions of the best performing model from the last window of each serie,
+        see the model's `predict_last`.
+        """
+        return self.model.predict_last(
+            dataset=dataset, futr_temporal=futr_temporal, **kwargs
+        )
+
     def set_test_size(self, test_size):
         self.model.set_test_size(test_size)
 
@@ -0,0 +1,209 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/common.base_model.ipynb.
+
+# %% auto 0
+__all__ = ['BaseModel']
+
+# %% ../../nbs/common.base_model.ipynb 3
+import numpy as np
+import torch
+import torch.nn as nn
+import pytorch_lightning as pl
+
+# %% ../../nbs/common.base_model.ipynb 4
+class BaseModel(pl.LightningModule):
+    """Base Model
+
+    Methods shared by the base classes of the models, the models inherit them
+    from `BaseWindows`, `BaseRecurrent` or `BaseMultivariate`.
+    """
+
+    def on_predict_start(self):
+        self._compile()
+
+    def _compile(self):
+        # `compile=True` compiles the module's call with `torch.compile`, the graphs
+        # are built on the first batches and reused while their shapes do not change.
+        # It is not a speedup in general, experiments/compile measured 0.81x to 1.14x
+        # the eager training throughput depending on the model, so it is an option
+        # to benchmark on the target hardware
+        if not self.compile_forward or getattr(self, "_compiled", False):
+            return
+        if hasattr(nn.Module, "compile"):
+            self.compile()
+        else:
+            # `nn.Module.compile` was added in torch 2.1
+            self.forward = torch.compile(self.forward)
+        self._compiled = True
+
+    def _column_plan(self, temporal_cols, static_cols=None):
+        # Positions of the columns used by the steps, resolved once for the
+        # columns of a dataset so that the steps only index tensors
+        def same(cols, other):
+            return cols is other or (
+                cols is not None and other is not None and cols.equals(other)
+            )
+
+        plan = self._columns
+        if (
+            plan is not None
+            and same(plan["temporal_cols"], temporal_cols)
+            and (static_cols is None or same(plan["static_cols"], static_cols))
+        ):
+            return plan
+
+        temporal_data_cols = temporal_cols.drop("available_mask")
+        stat_exog = None
+        if static_cols is not None:
+            stat_exog = torch.tensor(
+                static_cols.get_indexer(self.stat_exog_list), dtype=torch.long
+            )
+        self._columns = dict(
+            temporal_cols=temporal_cols,
+            static_cols=static_cols,
+            y=temporal_cols.get_loc("y"),
+            mask=temporal_cols.get_loc("available_mask"),
+            data=torch.tensor(
+                temporal_cols.get_indexer(temporal_data_cols), dtype=torch.long
+            ),
+            y_data=torch.tensor(
+                temporal_data_cols.get_indexer(["y"]), dtype=torch.long
+            ),
+            hist_exog=torch.tensor(
+                temporal_cols.get_indexer(self.hist_exog_list), dtype=torch.long
+            ),
+            futr_exog=torch.tensor(
+                temporal_cols.get_indexer(self.futr_exog_list), dtype=torch.long
+            ),
+            stat_exog=stat_exog,
+        )
+        return self._columns
+
+    def _float_output(self, output):
+        # Outputs of bfloat16 autocast (`precision='bf16-mixed'`) are cast back to float32,
+        # the inverse scaling, losses and samples are computed in float32
+        if isinstance(output, (tuple, list)):
+            return type(output)(self._float_output(o) for o in output)
+        if torch.is_tensor(output) and torch.is_floating_point(output):
+            return output.float()
+        return output
+
+    def _autocast(self):
+        # Autocast of PL's mixed `precision`, for the predictions without the `Trainer`
+        precision = str(self.trainer_kwargs.get("precision", "32"))
+        dtype = torch.float16 if precision in ["16-mixed", "16"] else torch.bfloat16
+        enabled = precision in ["bf16-mixed", "bf16", "16-mixed", "16"]
+        return torch.autocast(
+            device_type=self.device.type, dtype=dtype, enabled=enabled
+        )
+
+    def predict_fast(
+        self, dataset, step_size=1, random_seed=None, **data_module_kwargs
+    ):
+        """Predict Fast.
+
+        `predict` without PL's `Trainer`, see `predict` with `engine='torch'`,
+        the other `predict` arguments (e.g. `test_size`) are passed through.
+        """
+        return self.predict(
+            dataset=dataset,
+            step_size=step_size,
+            random_seed=random_seed,
+            engine="torch",
+            **data_module_kwargs,
+        )
+
+    def predict_last(self, dataset, futr_temporal=None, random_seed=None):
+        """Predict Last.
+
+        Forecasts the `h` steps after the end of each serie from its last `input_size`
+        observations only, without `TimeSeriesDataset.update_dataset`, the windows of the
+        series' history nor PL's `Trainer`, so that the latency does not depend on the history length.
+        The forecasts are the same as `predict`'s on the dataset updated with the future rows.
+
+        **Parameters:**<br>
+        `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
+        `futr_temporal`: torch.Tensor=None, [n_series, h, C] future rows of the dataset's `temporal_cols`, required with `futr_exog_list`.<br>
+        `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        """
+        if len(self.futr_exog_list) > 0 and futr_temporal is None:
+            raise Exception(
+                "`futr_temporal` is required with future exogenous variables"
+            )
+
+        # Restart random seed
+        if random_seed is None:
+            random_seed = self.random_seed
+        torch.manual_seed(random_seed)
+
+        # A single window per serie, as `predict` with `test_size=h`
+        batch = dataset.last_windows(
+            size=self.input_size, h=self.h, futr_temporal=futr_temporal
+        )
+        old_test_size = self.test_size
+        self.test_size = self.h
+        self.predict_step_size = 1
+        self.decompose_forecast = False
+        fcsts = self._predict_loop([batch])
+        self.test_size = old_test_size
+        return self._predict_rows(fcsts[0])
+
+    def _predict_loop(self, batches):
+        # Runs `predict_step` over the batches without PL's `Trainer`,
+        # on the model's device and in inference mode as `Trainer.predict` does
+        self._compile()
+        training = self.training
+        self.eval()
+        fcsts = []
+        with torch.inference_mode(), self._autocast():
+            for batch_idx, batch in enumerate(batches):
+                batch = self.transfer_batch_to_device(batch, self.device, 0)
+                y_hat = self.predict_step(batch, batch_idx).cpu()
+                self.on_predict_batch_end(y_hat, batch, batch_idx)
+                if self._predict_out is None:
+                    fcsts.append(y_hat)
+        self.train(training)
+        return fcsts
+
+    def _predict_datamodule(self, datamodule, engine="lightning", out=None):
+        # Runs `predict_step` over the datamodule's predict batches, with PL's `Trainer`
+        # or the plain loop of `engine='torch'`, and returns the forecasts' rows
+        if engine not in ["lightning", "torch"]:
+            raise ValueError(f"engine must be 'lightning' or 'torch', got {engine!r}")
+
+        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
+        pred_trainer_kwargs = self.trainer_kwargs.copy()
+        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
+            torch.cuda.device_count() > 1
+        ):
+            pred_trainer_kwargs["devices"] = [0]
+
+        # Forecasts of each batch are written in `out`, see `on_predict_batch_end`
+        self._predict_out = out
+        self._predict_offset = 0
+        try:
+            if engine == "torch":
+                fcsts = self._predict_loop(datamodule.predict_dataloader())
+            else:
+                trainer = pl.Trainer(**pred_trainer_kwargs)
+                fcsts = trainer.predict(
+                    self, datamodule=datamodule, return_predictions=out is None
+                )
+        finally:
+            self._predict_out = None
+        if out is None:
+            return np.concatenate([self._predict_rows(fcst) for fcst in fcsts])
+        if self._predict_offset != len(out):
+            raise Exception(
+                f"`out` has {len(out)} rows, the forecasts have {self._predict_offset}"
+            )
+        return out
+
+    def on_predict_batch_end(self, outputs, batch, batch_idx, dataloader_idx=0):
+        # Writes the batch's forecasts in the preallocated `predict` output
+        if self._predict_out is None:
+            return
+        rows = self._predict_rows(outputs.cpu())
+        self._predict_out[
+            self._predict_offset : self._predict_offset + len(rows)
+        ] = rows
+        self._predict_offset += len(rows)
@@ -14,11 +14,12 @@ import pytorch_lightning as pl
 from pytorch_lightning.callbacks import TQDMProgressBar
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 
+from ._base_model import BaseModel
 from ._scalers import TemporalNorm
 from ..tsdataset import TimeSeriesDataModule
 
 # %% ../../nbs/common.base_multivariate.ipynb 5
-class BaseMultivariate(pl.LightningModule):
+class BaseMultivariate(BaseModel):
     """Base Multivariate
 
     Base class for all multivariate models. The forecasts for all time-series are produced simultaneously
@@ -50,6 +51,8 @@ class BaseMultivariate(pl.LightningModule):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        device_resident=False,
+        compile=False,
         random_seed=1,
         alias=None,
         **trainer_kwargs,
@@ -143,9 +146,16 @@ class BaseMultivariate(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.device_resident = device_resident
+        self.compile_forward = compile
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
+        # `predict` output written by on_predict_batch_end hook
+        self._predict_out = None
+        self._predict_offset = 0
         self.alias = alias
+        # column positions, see `_column_plan`
+        self._columns = None
 
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
@@ -154,6 +164,7 @@ class BaseMultivariate(pl.LightningModule):
         torch.manual_seed(self.random_seed)
         np.random.seed(self.random_seed)
         random.seed(self.random_seed)
+        self._compile()
 
     def configure_optimizers(self):
         optimizer = torch.optim.Adam(self.parameters(), lr=self.learning_rate)
@@ -184,7 +195,7 @@ class BaseMultivariate(pl.LightningModule):
             # [n_series, C, Ws, L+H] 0, 1, 2, 3
 
             # Sample and Available conditions
-            available_idx = temporal_cols.get_loc("available_mask")
+            available_idx = self._column_plan(temporal_cols)["mask"]
             sample_condition = windows[:, available_idx, :, -self.h :]
             sample_condition = torch.sum(sample_condition, axis=2)  # Sum over time
             sample_condition = torch.sum(
@@ -277,14 +288,11 @@ class BaseMultivariate(pl.LightningModule):
         # windows are already filtered by train/validation/test
         # from the `create_windows_method` nor leakage risk
         temporal = windows["temporal"]  # [Ws, C, L+H, n_series]
-        temporal_cols = windows["temporal_cols"].copy()  # [Ws, C, L+H, n_series]
+        columns = self._column_plan(windows["temporal_cols"])
 
         # To avoid leakage uses only the lags
-        temporal_data_cols = temporal_cols.drop("available_mask").tolist()
-        temporal_data = temporal[:, temporal_cols.get_indexer(temporal_data_cols), :, :]
-        temporal_mask = temporal[
-            :, temporal_cols.get_loc("available_mask"), :, :
-        ].clone()
+        temporal_data = temporal[:, columns["data"], :, :]
+        temporal_mask = temporal[:, columns["mask"], :, :].clone()
         temporal_mask[:, -self.h :, :] = 0.0
 
         # Normalize. self.scaler stores the shift and scale for inverse transform
@@ -293,7 +301,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # Add channel dimension for scaler.transform.
         temporal_data = self.scaler.transform(x=temporal_data, mask=temporal_mask)
         # Replace values in windows dict
-        temporal[:, temporal_cols.get_indexer(temporal_data_cols), :, :] = temporal_data
+        temporal[:, columns["data"], :, :] = temporal_data
         windows["temporal"] = temporal
 
         return windows
@@ -309,13 +317,9 @@ class BaseMultivariate(pl.LightningModule):
         # else:
         #     remove_dimension = False
 
-        temporal_data_cols = temporal_cols.drop("available_mask")
-        y_scale = self.scaler.x_scale[
-            :, temporal_data_cols.get_indexer(["y"]), :
-        ].squeeze(1)
-        y_loc = self.scaler.x_shift[
-            :, temporal_data_cols.get_indexer(["y"]), :
-        ].squeeze(1)
+        y_data_idx = self._column_plan(temporal_cols)["y_data"]
+        y_scale = self.scaler.x_scale[:, y_data_idx, :].squeeze(1)
+        y_loc = self.scaler.x_shift[:, y_data_idx, :].squeeze(1)
 
         # y_scale = torch.repeat_interleave(y_scale, repeats=y_hat.shape[-1], dim=-1)
         # y_loc = torch.repeat_interleave(y_loc, repeats=y_hat.shape[-1], dim=-1)
@@ -333,8 +337,9 @@ class BaseMultivariate(pl.LightningModule):
         # Temporal: [Ws, C, L+H, n_series]
 
         # Filter insample lags from outsample horizon
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        columns = self._column_plan(windows["temporal_cols"], windows["static_cols"])
+        y_idx = columns["y"]
+        mask_idx = columns["mask"]
         insample_y = windows["temporal"][:, y_idx, : -self.h, :]
         insample_mask = windows["temporal"][:, mask_idx, : -self.h, :]
         outsample_y = windows["temporal"][:, y_idx, -self.h :, :]
@@ -342,22 +347,19 @@ class BaseMultivariate(pl.LightningModule):
 
         # Filter historic exogenous variables
         if len(self.hist_exog_list):
-            hist_exog_idx = windows["temporal_cols"].get_indexer(self.hist_exog_list)
-            hist_exog = windows["temporal"][:, hist_exog_idx, : -self.h, :]
+            hist_exog = windows["temporal"][:, columns["hist_exog"], : -self.h, :]
         else:
             hist_exog = None
 
         # Filter future exogenous variables
         if len(self.futr_exog_list):
-            futr_exog_idx = windows["temporal_cols"].get_indexer(self.futr_exog_list)
-            futr_exog = windows["temporal"][:, futr_exog_idx, :, :]
+            futr_exog = windows["temporal"][:, columns["futr_exog"], :, :]
         else:
             futr_exog = None
 
         # Filter static variables
         if len(self.stat_exog_list):
-            static_idx = windows["static_cols"].get_indexer(self.stat_exog_list)
-            stat_exog = windows["static"][:, static_idx]
+            stat_exog = windows["static"][:, columns["stat_exog"]]
         else:
             stat_exog = None
 
@@ -396,7 +398,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # [n_series, n_feats]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._float_output(self(windows_batch))
         if self.loss.is_distribution_output:
             outsample_y, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -447,7 +449,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # [Ws, 1]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._float_output(self(windows_batch))
         if self.loss.is_distribution_output:
             outsample_y, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -512,7 +514,7 @@ class BaseMultivariate(pl.LightningModule):
         )  # [Ws, 1]
 
         # Model Predictions
-        output = self(windows_batch)
+        output = self._float_output(self(windows_batch))
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=output[0], temporal_cols=batch["temporal_cols"]
@@ -586,6 +588,7 @@ class BaseMultivariate(pl.LightningModule):
             batch_size=self.n_series,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            device_resident=self.device_resident,
         )
 
         if self.val_check_steps > self.max_steps:
@@ -606,6 +609,8 @@ class BaseMultivariate(pl.LightningModule):
         test_size=None,
         step_size=1,
         random_seed=None,
+        engine="lightning",
+        out=None,
         **data_module_kwargs,
     ):
         """Predict.
@@ -616,6 +621,8 @@ class BaseMultivariate(pl.LightningModule):
         `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
+        `engine`: str='lightning', 'lightning' runs `predict_step` with PL's `Trainer`, 'torch' runs it in a plain loop, with the same outputs and without the trainer's setup latency.<br>
+        `out`: np.ndarray=None, preallocated [n_rows, n_outputs] array (e.g. a `np.memmap`) where the forecasts of each batch are written, returned instead of a new array.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
 
@@ -648,21 +655,13 @@ class BaseMultivariate(pl.LightningModule):
             dataset=dataset, batch_size=self.n_series, **data_module_kwargs
         )
 
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
-        fcsts = torch.vstack(fcsts).numpy()
-
-        fcsts = np.transpose(fcsts, (2, 0, 1))
-        fcsts = fcsts.flatten()
-        fcsts = fcsts.reshape(-1, len(self.loss.output_names))
-        return fcsts
+        return self._predict_datamodule(datamodule, engine=engine, out=out)
+
+    def _predict_rows(self, y_hat):
+        # [Ws, H, n_series] forecasts as the series' rows of `predict`,
+        # the single predict batch holds all the series (`batch_size=n_series`)
+        y_hat = np.transpose(y_hat.numpy(), (2, 0, 1))
+        return y_hat.reshape(-1, len(self.loss.output_names))
 
     def decompose(self, dataset, step_size=1, random_seed=None, **data_module_kwargs):
         raise NotImplementedError("decompose")
@@ -14,11 +14,12 @@ import pytorch_lightning as pl
 from pytorch_lightning.callbacks import TQDMProgressBar
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 
+from ._base_model import BaseModel
 from ._scalers import TemporalNorm
 from ..tsdataset import TimeSeriesDataModule
 
 # %% ../../nbs/common.base_recurrent.ipynb 6
-class BaseRecurrent(pl.LightningModule):
+class BaseRecurrent(BaseModel):
     """Base Recurrent
 
     Base class for all recurrent-based models. The forecasts are produced sequentially between
@@ -50,6 +51,9 @@ class BaseRecurrent(pl.LightningModule):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        length_bucketing=False,
+        device_resident=False,
+        compile=False,
         random_seed=1,
         alias=None,
         **trainer_kwargs,
@@ -153,9 +157,17 @@ class BaseRecurrent(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.length_bucketing = length_bucketing
+        self.device_resident = device_resident
+        self.compile_forward = compile
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
+        # `predict` output written by on_predict_batch_end hook
+        self._predict_out = None
+        self._predict_offset = 0
         self.alias = alias
+        # column positions, see `_column_plan`
+        self._columns = None
 
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
@@ -164,6 +176,7 @@ class BaseRecurrent(pl.LightningModule):
         torch.manual_seed(self.random_seed)
         np.random.seed(self.random_seed)
         random.seed(self.random_seed)
+        self._compile()
 
     def configure_optimizers(self):
         optimizer = torch.optim.Adam(self.parameters(), lr=self.learning_rate)
@@ -178,12 +191,11 @@ class BaseRecurrent(pl.LightningModule):
 
     def _normalization(self, batch, val_size=0, test_size=0):
         temporal = batch["temporal"]  # B, C, T
-        temporal_cols = batch["temporal_cols"].copy()
+        columns = self._column_plan(batch["temporal_cols"])
 
         # Separate data and mask
-        temporal_data_cols = temporal_cols.drop("available_mask").tolist()
-        temporal_data = temporal[:, temporal_cols.get_indexer(temporal_data_cols), :]
-        temporal_mask = temporal[:, temporal_cols.get_loc("available_mask"), :].clone()
+        temporal_data = temporal[:, columns["data"], :]
+        temporal_mask = temporal[:, columns["mask"], :].clone()
 
         # Remove validation and test set to prevent leakeage
         if val_size + test_size > 0:
@@ -197,7 +209,7 @@ class BaseRecurrent(pl.LightningModule):
         temporal_data = self.scaler.transform(x=temporal_data, mask=temporal_mask)
 
         # Replace values in windows dict
-        temporal[:, temporal_cols.get_indexer(temporal_data_cols), :] = temporal_data
+        temporal[:, columns["data"], :] = temporal_data
         batch["temporal"] = temporal
 
         return batch
@@ -207,13 +219,9 @@ class BaseRecurrent(pl.LightningModule):
         # Broadcasts outputs and inverts normalization
 
         # Get 'y' scale and shift, and add W dimension
-        temporal_data_cols = temporal_cols.drop("available_mask")
-        y_loc = self.scaler.x_shift[
-            :, temporal_data_cols.get_indexer(["y"]), 0
-        ].flatten()  # [B,C,T] -> [B]
-        y_scale = self.scaler.x_scale[
-            :, temporal_data_cols.get_indexer(["y"]), 0
-        ].flatten()  # [B,C,T] -> [B]
+        y_data_idx = self._column_plan(temporal_cols)["y_data"]
+        y_loc = self.scaler.x_shift[:, y_data_idx, 0].flatten()  # [B,C,T] -> [B]
+        y_scale = self.scaler.x_scale[:, y_data_idx, 0].flatten()  # [B,C,T] -> [B]
 
         # Expand scale and shift to y_hat dimensions
         y_loc = y_loc.view(*y_loc.shape, *(1,) * (y_hat.ndim - 1))  # .expand(y_hat)
@@ -238,7 +246,7 @@ class BaseRecurrent(pl.LightningModule):
             # Truncate batch to shorter time-series
             av_condition = torch.nonzero(
                 torch.min(
-                    temporal[:, temporal_cols.get_loc("available_mask")], axis=0
+                    temporal[:, self._column_plan(temporal_cols)["mask"]], axis=0
                 ).values
             )
             min_time_stamp = int(av_condition.min())
@@ -264,8 +272,11 @@ class BaseRecurrent(pl.LightningModule):
                 temporal = self.padder(temporal)
 
             # Test size covers all data, pad left one timestep with zeros
-            if temporal.shape[-1] == self.test_size:
-                padder_left = nn.ConstantPad1d(padding=(1, 0), value=0)
+            # (batches are only padded to their longest serie, which can be shorter)
+            if temporal.shape[-1] <= self.test_size:
+                padder_left = nn.ConstantPad1d(
+                    padding=(self.test_size - temporal.shape[-1] + 1, 0), value=0
+                )
                 temporal = padder_left(temporal)
 
         # Parse batch
@@ -303,8 +314,9 @@ class BaseRecurrent(pl.LightningModule):
     def _parse_windows(self, batch, windows):
         # [B, C, seq_len, 1+H]
         # Filter insample lags from outsample horizon
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        columns = self._column_plan(windows["temporal_cols"], windows["static_cols"])
+        y_idx = columns["y"]
+        mask_idx = columns["mask"]
         insample_y = windows["temporal"][:, y_idx, :, : -self.h]
         insample_mask = windows["temporal"][:, mask_idx, :, : -self.h]
         outsample_y = windows["temporal"][:, y_idx, :, -self.h :].contiguous()
@@ -312,21 +324,18 @@ class BaseRecurrent(pl.LightningModule):
 
         # Filter historic exogenous variables
         if len(self.hist_exog_list):
-            hist_exog_idx = windows["temporal_cols"].get_indexer(self.hist_exog_list)
-            hist_exog = windows["temporal"][:, hist_exog_idx, :, : -self.h]
+            hist_exog = windows["temporal"][:, columns["hist_exog"], :, : -self.h]
         else:
             hist_exog = None
 
         # Filter future exogenous variables
         if len(self.futr_exog_list):
-            futr_exog_idx = windows["temporal_cols"].get_indexer(self.futr_exog_list)
-            futr_exog = windows["temporal"][:, futr_exog_idx, :, :]
+            futr_exog = windows["temporal"][:, columns["futr_exog"], :, :]
         else:
             futr_exog = None
         # Filter static variables
         if len(self.stat_exog_list):
-            static_idx = windows["static_cols"].get_indexer(self.stat_exog_list)
-            stat_exog = windows["static"][:, static_idx]
+            stat_exog = windows["static"][:, columns["stat_exog"]]
         else:
             stat_exog = None
 
@@ -367,7 +376,9 @@ class BaseRecurrent(pl.LightningModule):
         )  # [B, S]
 
         # Model predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H, output])
+        output = self._float_output(
+            self(windows_batch)
+        )  # tuple([B, seq_len, H, output])
         if self.loss.is_distribution_output:
             outsample_y, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -436,7 +447,9 @@ class BaseRecurrent(pl.LightningModule):
         outsample_mask = outsample_mask[:, -val_windows:-1, :]
 
         # Model predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H, output])
+        output = self._float_output(
+            self(windows_batch)
+        )  # tuple([B, seq_len, H, output])
         if self.loss.is_distribution_output:
             output = [arg[:, -val_windows:-1] for arg in output]
             outsample_y, y_loc, y_scale = self._inv_normalization(
@@ -530,7 +543,7 @@ class BaseRecurrent(pl.LightningModule):
         )  # [B, S]
 
         # Model Predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H], ...)
+        output = self._float_output(self(windows_batch))  # tuple([B, seq_len, H], ...)
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=output[0], temporal_cols=batch["temporal_cols"]
@@ -612,6 +625,8 @@ class BaseRecurrent(pl.LightningModule):
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            length_bucketing=self.length_bucketing,
+            device_resident=self.device_resident,
         )
 
         if self.val_check_steps > self.max_steps:
@@ -626,7 +641,15 @@ class BaseRecurrent(pl.LightningModule):
         trainer = pl.Trainer(**self.trainer_kwargs)
         trainer.fit(self, datamodule=datamodule)
 
-    def predict(self, dataset, step_size=1, random_seed=None, **data_module_kwargs):
+    def predict(
+        self,
+        dataset,
+        step_size=1,
+        random_seed=None,
+        engine="lightning",
+        out=None,
+        **data_module_kwargs,
+    ):
         """Predict.
 
         Neural network prediction with PL's `Trainer` execution of `predict_step`.
@@ -635,6 +658,8 @@ class BaseRecurrent(pl.LightningModule):
         `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `engine`: str='lightning', 'lightning' runs `predict_step` with PL's `Trainer`, 'torch' runs it in a plain loop, with the same outputs and without the trainer's setup latency.<br>
+        `out`: np.ndarray=None, preallocated [n_rows, n_outputs] array (e.g. a `np.memmap`) where the forecasts of each batch are written, returned instead of a new array.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
 
@@ -664,35 +689,32 @@ class BaseRecurrent(pl.LightningModule):
         if step_size > 1:
             raise Exception("Recurrent models do not support step_size > 1")
 
-        # fcsts (window, batch, h)
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             **data_module_kwargs,
         )
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        return self._predict_datamodule(datamodule, engine=engine, out=out)
+
+    def predict_last(self, dataset, futr_temporal=None, random_seed=None):
+        """Predict Last.
+
+        Not available for recurrent models, their forecasts depend on the whole
+        history through the scaler and the `inference_input_size`, use `predict`.
+        """
+        raise Exception(
+            f"{type(self).__name__} forecasts from the whole history, use `predict`"
+        )
+
+    def _predict_rows(self, y_hat):
         if self.test_size > 0:
             # Remove warmup windows (from train and validation)
             # [N,T,H,output], avoid indexing last dim for univariate output compatibility
-            fcsts = torch.vstack(
-                [fcst[:, -(1 + self.test_size - self.h) :, :] for fcst in fcsts]
-            )
-            fcsts = fcsts.numpy().flatten()
-            fcsts = fcsts.reshape(-1, len(self.loss.output_names))
+            y_hat = y_hat[:, -(1 + self.test_size - self.h) :, :]
         else:
-            fcsts = torch.vstack([fcst[:, -1:, :] for fcst in fcsts]).numpy().flatten()
-            fcsts = fcsts.reshape(-1, len(self.loss.output_names))
-        return fcsts
+            y_hat = y_hat[:, -1:, :]
+        return y_hat.numpy().reshape(-1, len(self.loss.output_names))
 
     def set_test_size(self, test_size):
         self.test_size = test_size
@@ -6,6 +6,7 @@ __all__ = ['BaseWindows']
 # %% ../../nbs/common.base_windows.ipynb 4
 import random
 import warnings
+from copy import deepcopy
 
 import numpy as np
 import torch
@@ -14,11 +15,12 @@ import pytorch_lightning as pl
 from pytorch_lightning.callbacks import TQDMProgressBar
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 
+from ._base_model import BaseModel
 from ._scalers import TemporalNorm
 from ..tsdataset import TimeSeriesDataModule
 
 # %% ../../nbs/common.base_windows.ipynb 5
-class BaseWindows(pl.LightningModule):
+class BaseWindows(BaseModel):
     """Base Windows
 
     Base class for all windows-based models. The forecasts are produced separately
@@ -28,6 +30,12 @@ class BaseWindows(pl.LightningModule):
     - PyTorch Lightning's methods training_step, validation_step, predict_step.<br>
     - fit and predict methods used by NeuralForecast.core class.<br>
     - sampling and wrangling methods to generate windows.
+
+    The models pass these training options to the class through their `**trainer_kwargs`:<br>
+    `length_bucketing`: bool=False, batches series of similar lengths together.<br>
+    `device_resident`: bool=False, keeps the padded dataset on the training device.<br>
+    `global_window_sampling`: bool=False, samples the `windows_batch_size` training windows from the whole dataset instead of each batch's series,
+    it raises a `ValueError` with `length_bucketing` or `device_resident`, which only apply to the batches of series.<br>
     """
 
     def __init__(
@@ -54,6 +62,13 @@ class BaseWindows(pl.LightningModule):
         exclude_insample_y=False,
         num_workers_loader=0,
         drop_last_loader=False,
+        length_bucketing=False,
+        device_resident=False,
+        global_window_sampling=False,
+        compile=False,
+        prefetch_windows=False,
+        valid_windows_batch_size=None,
+        valid_windows_sample=None,
         random_seed=1,
         alias=None,
         **trainer_kwargs,
@@ -95,6 +110,11 @@ class BaseWindows(pl.LightningModule):
             self.inference_windows_batch_size = windows_batch_size
         else:
             self.inference_windows_batch_size = inference_windows_batch_size
+        if valid_windows_batch_size is None:
+            self.valid_windows_batch_size = self.inference_windows_batch_size
+        else:
+            self.valid_windows_batch_size = valid_windows_batch_size
+        self.valid_windows_sample = valid_windows_sample
 
         # Optimization
         self.learning_rate = learning_rate
@@ -163,9 +183,19 @@ class BaseWindows(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.length_bucketing = length_bucketing
+        self.device_resident = device_resident
+        self.global_window_sampling = global_window_sampling
+        self.compile_forward = compile
+        self.prefetch_windows = prefetch_windows
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
+        # `predict` output written by on_predict_batch_end hook
+        self._predict_out = None
+        self._predict_offset = 0
         self.alias = alias
+        # column positions, see `_column_plan`
+        self._columns = None
 
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
@@ -174,6 +204,7 @@ class BaseWindows(pl.LightningModule):
         torch.manual_seed(self.random_seed)
         np.random.seed(self.random_seed)
         random.seed(self.random_seed)
+        self._compile()
 
     def configure_optimizers(self):
         optimizer = torch.optim.Adam(self.parameters(), lr=self.learning_rate)
@@ -193,152 +224,188 @@ class BaseWindows(pl.LightningModule):
         temporal = batch["temporal"]
 
         if step == "train":
+            if batch.get("sampled", False):
+                # Windows already sampled from the whole dataset [Ws, L+H, C]
+                windows_batch = dict(
+                    temporal=temporal,
+                    temporal_cols=temporal_cols,
+                    static=batch.get("static", None),
+                    static_cols=batch.get("static_cols", None),
+                )
+                return windows_batch
+
             if self.val_size + self.test_size > 0:
                 cutoff = -self.val_size - self.test_size
                 temporal = temporal[:, :, :cutoff]
 
             temporal = self.padder_train(temporal)
             if temporal.shape[-1] < window_size:
-                raise Exception(
-                    "Time series is too short for training, consider setting a smaller input size or set start_padding_enabled=True"
+                # Batches are only padded to their longest serie, complete the window
+                padder_left = nn.ConstantPad1d(
+                    padding=(window_size - temporal.shape[-1], 0), value=0
                 )
+                temporal = padder_left(temporal)
             windows = temporal.unfold(
                 dimension=-1, size=window_size, step=self.step_size
             )
 
             # [B, C, Ws, L+H] 0, 1, 2, 3
-            # -> [B * Ws, L+H, C] 0, 2, 3, 1
-            windows_per_serie = windows.shape[2]
-            windows = windows.permute(0, 2, 3, 1).contiguous()
-            windows = windows.reshape(-1, window_size, len(temporal_cols))
-
-            # Sample and Available conditions
-            available_idx = temporal_cols.get_loc("available_mask")
-            available_condition = windows[:, : self.input_size, available_idx]
-            available_condition = torch.sum(available_condition, axis=1)
+            # -> [B, Ws, L+H, C] 0, 2, 3, 1, a view of temporal
+            windows = windows.permute(0, 2, 3, 1)
+            windows_per_serie = windows.shape[1]
+
+            # Sample and Available conditions, counted from the available mask's
+            # cumulative sum [B, T+1] at the start, end of input and end of each window
+            available_idx = self._column_plan(temporal_cols)["mask"]
+            available = (temporal[:, available_idx, :] > 0).cumsum(dim=-1)
+            available = nn.functional.pad(available, (1, 0))
+            starts = (
+                torch.arange(windows_per_serie, device=temporal.device) * self.step_size
+            )
+            available_condition = (
+                available[:, starts + self.input_size] - available[:, starts]
+            )
             final_condition = available_condition > 0
             if self.h > 0:
-                sample_condition = windows[:, self.input_size :, available_idx]
-                sample_condition = torch.sum(sample_condition, axis=1)
-                final_condition = (sample_condition > 0) & (available_condition > 0)
-            windows = windows[final_condition]
-
-            # Parse Static data to match windows
-            # [B, S_in] -> [B, Ws, S_in] -> [B*Ws, S_in]
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-            if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
+                sample_condition = (
+                    available[:, starts + window_size]
+                    - available[:, starts + self.input_size]
                 )
-                static = static[final_condition]
+                final_condition = (sample_condition > 0) & (available_condition > 0)
 
             # Protection of empty windows
             if final_condition.sum() == 0:
                 raise Exception("No windows available for training")
 
-            # Sample windows
-            n_windows = len(windows)
+            # Sample windows, [B * Ws] positions of the available windows
+            w_idxs = torch.nonzero(final_condition.flatten()).squeeze(-1)
+            n_windows = len(w_idxs)
             if self.windows_batch_size is not None:
-                w_idxs = np.random.choice(
+                sample_idxs = np.random.choice(
                     n_windows,
                     size=self.windows_batch_size,
                     replace=(n_windows < self.windows_batch_size),
                 )
-                windows = windows[w_idxs]
+                w_idxs = w_idxs[torch.as_tensor(sample_idxs, device=w_idxs.device)]
 
-                if static is not None:
-                    static = static[w_idxs]
-
-            # think about interaction available * sample mask
-            # [B, C, Ws, L+H]
-            windows_batch = dict(
+            # Only the sampled windows [Ws, L+H, C] and their static data are gathered
+            windows = dict(
                 temporal=windows,
                 temporal_cols=temporal_cols,
-                static=static,
-                static_cols=static_cols,
+                static=batch.get("static", None),
+                static_cols=batch.get("static_cols", None),
             )
+            windows_batch = self._sample_windows(windows, w_idxs)
             return windows_batch
 
         elif step in ["predict", "val"]:
-            if step == "predict":
-                initial_input = temporal.shape[-1] - self.test_size
-                if (
-                    initial_input <= self.input_size
-                ):  # There is not enough data to predict first timestamp
-                    padder_left = nn.ConstantPad1d(
-                        padding=(self.input_size - initial_input, 0), value=0
-                    )
-                    temporal = padder_left(temporal)
-                predict_step_size = self.predict_step_size
-                cutoff = -self.input_size - self.test_size
-                temporal = temporal[:, :, cutoff:]
-
-            elif step == "val":
-                predict_step_size = self.step_size
-                cutoff = -self.input_size - self.val_size - self.test_size
-                if self.test_size > 0:
-                    temporal = batch["temporal"][:, :, cutoff : -self.test_size]
-                else:
-                    temporal = batch["temporal"][:, :, cutoff:]
-                if temporal.shape[-1] < window_size:
-                    initial_input = temporal.shape[-1] - self.val_size
-                    padder_left = nn.ConstantPad1d(
-                        padding=(self.input_size - initial_input, 0), value=0
-                    )
-                    temporal = padder_left(temporal)
+            windows = self._unfold_windows(batch, step)
+            if w_idxs is None:
+                w_idxs = np.arange(
+                    windows["temporal"].shape[0] * windows["temporal"].shape[1]
+                )
+            return self._sample_windows(windows, w_idxs)
+        else:
+            raise ValueError(f"Unknown step {step}")
+
+    def _unfold_windows(self, batch, step):
+        # Unfold the prediction or validation windows of a batch without copying them
+        window_size = self.input_size + self.h
+        temporal_cols = batch["temporal_cols"]
+        temporal = batch["temporal"]
 
+        if step == "predict":
+            initial_input = temporal.shape[-1] - self.test_size
             if (
-                (step == "predict")
-                and (self.test_size == 0)
-                and (len(self.futr_exog_list) == 0)
-            ):
-                padder_right = nn.ConstantPad1d(padding=(0, self.h), value=0)
-                temporal = padder_right(temporal)
+                initial_input <= self.input_size
+            ):  # There is not enough data to predict first timestamp
+                padder_left = nn.ConstantPad1d(
+                    padding=(self.input_size - initial_input, 0), value=0
+                )
+                temporal = padder_left(temporal)
+            predict_step_size = self.predict_step_size
+            cutoff = -self.input_size - self.test_size
+            temporal = temporal[:, :, cutoff:]
+
+        elif step == "val":
+            predict_step_size = self.step_size
+            cutoff = -self.input_size - self.val_size - self.test_size
+            if self.test_size > 0:
+                temporal = batch["temporal"][:, :, cutoff : -self.test_size]
+            else:
+                temporal = batch["temporal"][:, :, cutoff:]
+            if temporal.shape[-1] < window_size:
+                initial_input = temporal.shape[-1] - self.val_size
+                padder_left = nn.ConstantPad1d(
+                    padding=(self.input_size - initial_input, 0), value=0
+                )
+                temporal = padder_left(temporal)
 
-            windows = temporal.unfold(
-                dimension=-1, size=window_size, step=predict_step_size
-            )
+        if (
+            (step == "predict")
+            and (self.test_size == 0)
+            and (len(self.futr_exog_list) == 0)
+        ):
+            padder_right = nn.ConstantPad1d(padding=(0, self.h), value=0)
+            temporal = padder_right(temporal)
 
-            # [batch, channels, windows, window_size] 0, 1, 2, 3
-            # -> [batch * windows, window_size, channels] 0, 2, 3, 1
-            windows_per_serie = windows.shape[2]
-            windows = windows.permute(0, 2, 3, 1).contiguous()
-            windows = windows.reshape(-1, window_size, len(temporal_cols))
-
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-            if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
-                )
+        windows = temporal.unfold(
+            dimension=-1, size=window_size, step=predict_step_size
+        )
 
-            # Sample windows for batched prediction
-            if w_idxs is not None:
-                windows = windows[w_idxs]
-                if static is not None:
-                    static = static[w_idxs]
+        # [batch, channels, windows, window_size] 0, 1, 2, 3
+        # -> [batch, windows, window_size, channels] 0, 2, 3, 1, a view of temporal
+        windows = windows.permute(0, 2, 3, 1)
+        windows_batch = dict(
+            temporal=windows,
+            temporal_cols=temporal_cols,
+            static=batch.get("static", None),
+            static_cols=batch.get("static_cols", None),
+        )
+        return windows_batch
 
-            windows_batch = dict(
-                temporal=windows,
-                temporal_cols=temporal_cols,
-                static=static,
-                static_cols=static_cols,
-            )
-            return windows_batch
-        else:
-            raise ValueError(f"Unknown step {step}")
+    def _sample_windows(self, windows, w_idxs):
+        # Gather the windows `w_idxs` [Ws, L+H, C] of an unfolded batch [B, Ws, L+H, C],
+        # only the sampled windows are copied
+        temporal = windows["temporal"]
+        windows_per_serie = temporal.shape[1]
+        w_idxs = torch.as_tensor(w_idxs, device=temporal.device)
+        serie_idxs = torch.div(w_idxs, windows_per_serie, rounding_mode="floor")
+        temporal = temporal[serie_idxs, w_idxs % windows_per_serie]
+
+        static = windows["static"]
+        if static is not None:
+            static = static[serie_idxs]
+
+        windows_batch = dict(
+            temporal=temporal,
+            temporal_cols=windows["temporal_cols"],
+            static=static,
+            static_cols=windows["static_cols"],
+        )
+        return windows_batch
+
+    def _valid_windows(self, n_windows, batch_idx):
+        # Validation windows of a batch, all of them or a random subset of
+        # `valid_windows_sample` windows, the same ones at every validation
+        if self.valid_windows_sample is None or self.valid_windows_sample >= n_windows:
+            return np.arange(n_windows)
+        rng = np.random.default_rng(self.random_seed + batch_idx)
+        return np.sort(
+            rng.choice(n_windows, size=self.valid_windows_sample, replace=False)
+        )
 
-    def _normalization(self, windows):
+    def _normalization(self, windows, scaler=None):
         # windows are already filtered by train/validation/test
         # from the `create_windows_method` nor leakage risk
+        if scaler is None:
+            scaler = self.scaler
         temporal = windows["temporal"]  # B, L+H, C
-        temporal_cols = windows["temporal_cols"].copy()  # B, L+H, C
+        columns = self._column_plan(windows["temporal_cols"])
 
         # To avoid leakage uses only the lags
-        temporal_data_cols = temporal_cols.drop("available_mask").tolist()
-        temporal_data = temporal[:, :, temporal_cols.get_indexer(temporal_data_cols)]
-        temporal_mask = temporal[:, :, temporal_cols.get_loc("available_mask")].clone()
+        temporal_data = temporal[:, :, columns["data"]]
+        temporal_mask = temporal[:, :, columns["mask"]].clone()
         if self.h > 0:
             temporal_mask[:, -self.h :] = 0.0
 
@@ -346,10 +413,10 @@ class BaseWindows(pl.LightningModule):
         temporal_mask = temporal_mask.unsqueeze(
             -1
         )  # Add channel dimension for scaler.transform.
-        temporal_data = self.scaler.transform(x=temporal_data, mask=temporal_mask)
+        temporal_data = scaler.transform(x=temporal_data, mask=temporal_mask)
 
         # Replace values in windows dict
-        temporal[:, :, temporal_cols.get_indexer(temporal_data_cols)] = temporal_data
+        temporal[:, :, columns["data"]] = temporal_data
         windows["temporal"] = temporal
 
         return windows
@@ -365,9 +432,9 @@ class BaseWindows(pl.LightningModule):
         else:
             remove_dimension = False
 
-        temporal_data_cols = temporal_cols.drop("available_mask")
-        y_scale = self.scaler.x_scale[:, :, temporal_data_cols.get_indexer(["y"])]
-        y_loc = self.scaler.x_shift[:, :, temporal_data_cols.get_indexer(["y"])]
+        y_data_idx = self._column_plan(temporal_cols)["y_data"]
+        y_scale = self.scaler.x_scale[:, :, y_data_idx]
+        y_loc = self.scaler.x_shift[:, :, y_data_idx]
 
         y_scale = torch.repeat_interleave(y_scale, repeats=y_hat.shape[-1], dim=-1).to(
             y_hat.device
@@ -389,8 +456,9 @@ class BaseWindows(pl.LightningModule):
 
     def _parse_windows(self, batch, windows):
         # Filter insample lags from outsample horizon
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        columns = self._column_plan(windows["temporal_cols"], windows["static_cols"])
+        y_idx = columns["y"]
+        mask_idx = columns["mask"]
 
         insample_y = windows["temporal"][:, : self.input_size, y_idx]
         insample_mask = windows["temporal"][:, : self.input_size, mask_idx]
@@ -407,16 +475,13 @@ class BaseWindows(pl.LightningModule):
             outsample_mask = windows["temporal"][:, self.input_size :, mask_idx]
 
         if len(self.hist_exog_list):
-            hist_exog_idx = windows["temporal_cols"].get_indexer(self.hist_exog_list)
-            hist_exog = windows["temporal"][:, : self.input_size, hist_exog_idx]
+            hist_exog = windows["temporal"][:, : self.input_size, columns["hist_exog"]]
 
         if len(self.futr_exog_list):
-            futr_exog_idx = windows["temporal_cols"].get_indexer(self.futr_exog_list)
-            futr_exog = windows["temporal"][:, :, futr_exog_idx]
+            futr_exog = windows["temporal"][:, :, columns["futr_exog"]]
 
         if len(self.stat_exog_list):
-            static_idx = windows["static_cols"].get_indexer(self.stat_exog_list)
-            stat_exog = windows["static"][:, static_idx]
+            stat_exog = windows["static"][:, columns["stat_exog"]]
 
         # TODO: think a better way of removing insample_y features
         if self.exclude_insample_y:
@@ -432,12 +497,14 @@ class BaseWindows(pl.LightningModule):
             stat_exog,
         )
 
-    def training_step(self, batch, batch_idx):
+    def _prepare_train_windows(self, batch, scaler):
+        # Windows of a training step, they do not depend on the model's parameters and
+        # are prepared ahead of the step with `prefetch_windows`, along with their scaling
         # Create and normalize windows [Ws, L+H, C]
         windows = self._create_windows(batch, step="train")
-        y_idx = batch["temporal_cols"].get_loc("y")
+        y_idx = self._column_plan(batch["temporal_cols"])["y"]
         original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
-        windows = self._normalization(windows=windows)
+        windows = self._normalization(windows=windows, scaler=scaler)
 
         # Parse windows
         (
@@ -458,8 +525,32 @@ class BaseWindows(pl.LightningModule):
             stat_exog=stat_exog,
         )  # [Ws, 1]
 
+        prepared = dict(
+            windows_batch=windows_batch,
+            outsample_y=outsample_y,
+            outsample_mask=outsample_mask,
+            original_outsample_y=original_outsample_y,
+            x_shift=scaler.x_shift,
+            x_scale=scaler.x_scale,
+            temporal_cols=batch["temporal_cols"],
+            prepared=True,
+        )
+        return prepared
+
+    def training_step(self, batch, batch_idx):
+        # Batches are already prepared by the train loader with `prefetch_windows`
+        if not batch.get("prepared", False):
+            batch = self._prepare_train_windows(batch, scaler=self.scaler)
+        self.scaler.x_shift = batch["x_shift"]
+        self.scaler.x_scale = batch["x_scale"]
+        windows_batch = batch["windows_batch"]
+        insample_y = windows_batch["insample_y"]
+        outsample_y = batch["outsample_y"]
+        outsample_mask = batch["outsample_mask"]
+        original_outsample_y = batch["original_outsample_y"]
+
         # Model Predictions
-        output = self(windows_batch)
+        output = self._float_output(self(windows_batch))
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
@@ -521,25 +612,25 @@ class BaseWindows(pl.LightningModule):
         if self.val_size == 0:
             return np.nan
 
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="val")
-        n_windows = len(windows["temporal"])
+        # Unfold the windows once, inference batches are gathered from the view
+        unfolded = self._unfold_windows(batch, step="val")
+        n_windows = unfolded["temporal"].shape[0] * unfolded["temporal"].shape[1]
 
-        # Number of windows in batch
-        windows_batch_size = self.inference_windows_batch_size
+        # Validation windows, streamed in chunks of `valid_windows_batch_size`
+        valid_idxs = self._valid_windows(n_windows, batch_idx)
+        windows_batch_size = self.valid_windows_batch_size
         if windows_batch_size < 0:
-            windows_batch_size = n_windows
-        n_batches = int(np.ceil(n_windows / windows_batch_size))
+            windows_batch_size = len(valid_idxs)
+        n_batches = int(np.ceil(len(valid_idxs) / windows_batch_size))
 
-        valid_losses = []
-        batch_sizes = []
+        # Running loss weighted by the number of windows of each chunk
+        valid_loss = 0
+        n_valid = 0
         for i in range(n_batches):
             # Create and normalize windows [Ws, L+H, C]
-            w_idxs = np.arange(
-                i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
-            )
-            windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
-            y_idx = batch["temporal_cols"].get_loc("y")
+            w_idxs = valid_idxs[i * windows_batch_size : (i + 1) * windows_batch_size]
+            windows = self._sample_windows(unfolded, w_idxs)
+            y_idx = self._column_plan(batch["temporal_cols"])["y"]
             original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
             windows = self._normalization(windows=windows)
 
@@ -562,19 +653,16 @@ class BaseWindows(pl.LightningModule):
             )  # [Ws, 1]
 
             # Model Predictions
-            output_batch = self(windows_batch)
+            output_batch = self._float_output(self(windows_batch))
             valid_loss_batch = self._compute_valid_loss(
                 outsample_y=original_outsample_y,
                 output=output_batch,
                 outsample_mask=outsample_mask,
                 temporal_cols=batch["temporal_cols"],
             )
-            valid_losses.append(valid_loss_batch)
-            batch_sizes.append(len(output_batch))
-
-        valid_loss = torch.stack(valid_losses)
-        batch_sizes = torch.tensor(batch_sizes).to(valid_loss.device)
-        valid_loss = torch.sum(valid_loss * batch_sizes) / torch.sum(batch_sizes)
+            valid_loss = valid_loss + valid_loss_batch * len(w_idxs)
+            n_valid += len(w_idxs)
+        valid_loss = valid_loss / n_valid
 
         if torch.isnan(valid_loss):
             raise Exception("Loss is NaN, training stopped.")
@@ -592,9 +680,9 @@ class BaseWindows(pl.LightningModule):
         self.validation_step_outputs.clear()  # free memory (compute `avg_loss` per epoch)
 
     def predict_step(self, batch, batch_idx):
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="predict")
-        n_windows = len(windows["temporal"])
+        # Unfold the windows once, inference batches are gathered from the view
+        unfolded = self._unfold_windows(batch, step="predict")
+        n_windows = unfolded["temporal"].shape[0] * unfolded["temporal"].shape[1]
 
         # Number of windows in batch
         windows_batch_size = self.inference_windows_batch_size
@@ -608,7 +696,13 @@ class BaseWindows(pl.LightningModule):
             w_idxs = np.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="predict", w_idxs=w_idxs)
+            n_valid = len(w_idxs)
+            if self.compile_forward:
+                # Pad the batch repeating its last window up to a power of two (at most
+                # the full batch), so that compiled graphs see a few stable shapes
+                size = min(windows_batch_size, 2 ** int(np.ceil(np.log2(n_valid))))
+                w_idxs = np.pad(w_idxs, (0, size - n_valid), mode="edge")
+            windows = self._sample_windows(unfolded, w_idxs)
             windows = self._normalization(windows=windows)
 
             # Parse windows
@@ -630,7 +724,7 @@ class BaseWindows(pl.LightningModule):
             )  # [Ws, 1]
 
             # Model Predictions
-            output_batch = self(windows_batch)
+            output_batch = self._float_output(self(windows_batch))
             # Inverse normalization and sampling
             if self.loss.is_distribution_output:
                 _, y_loc, y_scale = self._inv_normalization(
@@ -652,7 +746,7 @@ class BaseWindows(pl.LightningModule):
                 y_hat, _, _ = self._inv_normalization(
                     y_hat=output_batch, temporal_cols=batch["temporal_cols"]
                 )
-            y_hats.append(y_hat)
+            y_hats.append(y_hat[:n_valid])
         y_hat = torch.cat(y_hats, dim=0)
         return y_hat
 
@@ -673,7 +767,7 @@ class BaseWindows(pl.LightningModule):
         disk memory, to get them change `enable_checkpointing=True` in `__init__`.
 
         **Parameters:**<br>
-        `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
+        `dataset`: NeuralForecast's `TimeSeriesDataset` or `TimeSeriesStreamDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `val_size`: int, validation size for temporal cross-validation.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
         `test_size`: int, test size for temporal cross-validation.<br>
@@ -704,12 +798,44 @@ class BaseWindows(pl.LightningModule):
 
         self.val_size = val_size
         self.test_size = test_size
+        train_size = dataset.max_size - val_size - test_size
+        if sum(self.padder_train.padding) + train_size < self.input_size + self.h:
+            raise Exception(
+                "Time series is too short for training, consider setting a smaller input size or set start_padding_enabled=True"
+            )
+
+        # Sample the training windows uniformly from the whole dataset
+        train_windows = None
+        if self.global_window_sampling and self.windows_batch_size is not None:
+            train_windows = dict(
+                input_size=self.input_size,
+                h=self.h,
+                padding=self.padder_train.padding,
+                cutoff=val_size + test_size,
+                step_size=self.step_size,
+                windows_batch_size=self.windows_batch_size,
+            )
+
+        # Training windows prepared in a background thread, with their own scaler
+        prefetch = None
+        if self.prefetch_windows:
+            if type(self).training_step is not BaseWindows.training_step:
+                raise Exception(
+                    f"prefetch_windows is not supported by {type(self).__name__}"
+                )
+            scaler = deepcopy(self.scaler)
+            prefetch = lambda batch: self._prepare_train_windows(batch, scaler=scaler)
+
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
             batch_size=self.batch_size,
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            length_bucketing=self.length_bucketing,
+            device_resident=self.device_resident,
+            train_windows=train_windows,
+            prefetch=prefetch,
         )
 
         if self.val_check_steps > self.max_steps:
@@ -730,6 +856,8 @@ class BaseWindows(pl.LightningModule):
         test_size=None,
         step_size=1,
         random_seed=None,
+        engine="lightning",
+        out=None,
         **data_module_kwargs,
     ):
         """Predict.
@@ -741,6 +869,8 @@ class BaseWindows(pl.LightningModule):
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `engine`: str='lightning', 'lightning' runs `predict_step` with PL's `Trainer`, 'torch' runs it in a plain loop, with the same outputs and without the trainer's setup latency.<br>
+        `out`: np.ndarray=None, preallocated [n_rows, n_outputs] array (e.g. a `np.memmap`) where the forecasts of each batch are written, returned instead of a new array.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
 
@@ -775,18 +905,11 @@ class BaseWindows(pl.LightningModule):
             **data_module_kwargs,
         )
 
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
+        return self._predict_datamodule(datamodule, engine=engine, out=out)
 
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
-        fcsts = torch.vstack(fcsts).numpy().flatten()
-        fcsts = fcsts.reshape(-1, len(self.loss.output_names))
-        return fcsts
+    def _predict_rows(self, y_hat):
+        # [Ws, H, output] forecasts of a batch as the [Ws * H, output] rows of `predict`
+        return y_hat.numpy().reshape(-1, len(self.loss.output_names))
 
     def decompose(self, dataset, step_size=1, random_seed=None, **data_module_kwargs):
         """Decompose Predictions.
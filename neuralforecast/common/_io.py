@@ -0,0 +1,93 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/common.io.ipynb.
+
+# %% auto 0
+__all__ = ['FORMAT_VERSION', 'save_array', 'check_files', 'save_index', 'load_index']
+
+# %% ../../nbs/common.io.ipynb 3
+import os
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# %% ../../nbs/common.io.ipynb 5
+# Version of the layout written by `TimeSeriesDataset.save` and `NeuralForecast.save`
+FORMAT_VERSION = 1
+
+
+def _checksum(file):
+    # CRC32 of a file, read in chunks
+    checksum = 0
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 24), b""):
+            checksum = zlib.crc32(chunk, checksum)
+    return checksum
+
+
+def save_array(file, array):
+    # Write to a temporary file and rename it, a dataset memory-mapped from
+    # `file` keeps reading the previous contents instead of a truncated file.
+    # Returns the entry of the file in the metadata, its size and checksum
+    with open(f"{file}.tmp", "wb") as f:
+        np.save(f, array)
+    os.replace(f"{file}.tmp", file)
+    return [os.path.getsize(file), _checksum(file)]
+
+
+def check_files(path, metadata, verify=False):
+    # Sizes are always compared, which detects truncated files in constant time,
+    # checksums are compared with `verify=True` as it reads the whole files
+    version = metadata.get("version", 0)
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"{path} was saved with format version {version}, "
+            f"this version of neuralforecast reads up to version {FORMAT_VERSION}"
+        )
+    for file, (size, checksum, *_) in metadata.get("files", {}).items():
+        if os.path.getsize(f"{path}/{file}") != size:
+            raise ValueError(
+                f"{path}/{file} is corrupted, its size does not match the saved size"
+            )
+        if verify and _checksum(f"{path}/{file}") != checksum:
+            raise ValueError(
+                f"{path}/{file} is corrupted, its checksum does not match the saved checksum"
+            )
+
+# %% ../../nbs/common.io.ipynb 6
+def save_index(file, index):
+    # Indexes are saved as numpy columns so that they load without pickle, object
+    # columns of strings or integers are converted to their numpy dtype. What the
+    # column does not keep is appended to the entry of the file in the metadata:
+    # tz-aware dates are saved as int64 nanoseconds in UTC along with their timezone,
+    # categorical indexes as their codes along with their categories and ordering
+    info = {}
+    if isinstance(index, pd.CategoricalIndex):
+        info["categories"] = index.categories.tolist()
+        info["ordered"] = bool(index.ordered)
+        values = index.codes
+    elif getattr(index, "tz", None) is not None:
+        info["tz"] = str(index.tz)
+        values = index.tz_convert("UTC").asi8
+    else:
+        values = index.to_numpy()
+    if values.dtype == object:
+        values = np.array(values.tolist())
+    entry = save_array(file, values)
+    if info:
+        entry.append(info)
+    return entry
+
+
+def load_index(file, entry, name, mmap=False):
+    # `entry` is the metadata of the file returned by `save_index`
+    values = np.load(file, mmap_mode="r" if mmap else None)
+    info = entry[2] if len(entry) > 2 else {}
+    if "categories" in info:
+        categories = pd.Categorical.from_codes(
+            values, categories=info["categories"], ordered=info["ordered"]
+        )
+        return pd.CategoricalIndex(categories, name=name)
+    if "tz" in info:
+        dates = pd.DatetimeIndex(values.view("datetime64[ns]"), name=name)
+        return dates.tz_localize("UTC").tz_convert(info["tz"])
+    return pd.Index(values, name=name)
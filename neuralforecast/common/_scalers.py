@@ -396,8 +396,9 @@ class TemporalNorm(nn.Module):
         **Returns:**<br>
         `z`: torch.Tensor same shape as `x`, except scaled.
         """
+        # Statistics are kept in float32, also for reduced precision inputs
         x_shift, x_scale = self.compute_statistics(
-            x=x, mask=mask, dim=self.dim, eps=self.eps
+            x=x.float(), mask=mask, dim=self.dim, eps=self.eps
         )
         self.x_shift = x_shift
         self.x_scale = x_scale
@@ -4,6 +4,7 @@
 __all__ = ['NeuralForecast']
 
 # %% ../nbs/core.ipynb 4
+import json
 import os
 import pickle
 import warnings
@@ -13,8 +14,10 @@ from typing import Any, List, Optional
 
 import numpy as np
 import pandas as pd
+import torch
 
 from .tsdataset import TimeSeriesDataset
+from .common import _io
 from neuralforecast.models import (
     GRU,
     LSTM,
@@ -114,7 +117,16 @@ def _future_dates(dataset, uids, last_dates, freq, h):
     df = pd.DataFrame({"ds": dates}, index=idx)
     return df
 
-# %% ../nbs/core.ipynb 11
+# %% ../nbs/core.ipynb 8
+def _load_ds(path, entry, uids):
+    # The `ds` MultiIndex is stored as the dates and the position of each row's serie in `uids`
+    dates = _io.load_index(f"{path}/ds.npy", entry, name="ds", mmap=True)
+    codes = np.load(f"{path}/ds_uids.npy", mmap_mode="r")
+    return pd.MultiIndex.from_arrays(
+        [uids.take(codes), dates], names=["unique_id", "ds"]
+    )
+
+# %% ../nbs/core.ipynb 12
 MODEL_FILENAME_DICT = {
     "gru": GRU,
     "lstm": LSTM,
@@ -152,9 +164,11 @@ MODEL_FILENAME_DICT = {
     "autotimesnet": TimesNet,
 }
 
-# %% ../nbs/core.ipynb 12
+# %% ../nbs/core.ipynb 13
 class NeuralForecast:
-    def __init__(self, models: List[Any], freq: str):
+    def __init__(
+        self, models: List[Any], freq: str, dataset_dtype: torch.dtype = torch.float32
+    ):
         """
         The `core.StatsForecast` class allows you to efficiently fit multiple `NeuralForecast` models
         for large sets of time series. It operates with pandas DataFrame `df` that identifies series
@@ -169,6 +183,9 @@ class NeuralForecast:
         freq : str
             Frequency of the data,
             see [panda's available frequencies](https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases).
+        dataset_dtype : torch.dtype (default=torch.float32)
+            Storage dtype of the temporal data, `torch.bfloat16` or `torch.float16` halve
+            the memory of the stored dataset. Batches are always casted to float32.
 
         Returns
         -------
@@ -183,17 +200,57 @@ class NeuralForecast:
         self.models_init = models
         self.models = [deepcopy(model) for model in self.models_init]
         self.freq = pd.tseries.frequencies.to_offset(freq)
+        self.dataset_dtype = dataset_dtype
 
         # Flags and attributes
         self._fitted = False
+        self._saved_ds = None
+        self._appended_ds = []
 
     def _prepare_fit(self, df, static_df, sort_df):
         # TODO: uids, last_dates and ds should be properties of the dataset class. See github issue.
-        dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
-            df=df, static_df=static_df, sort_df=sort_df
-        )
+        if isinstance(df, pd.DataFrame):
+            dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
+                df=df, static_df=static_df, sort_df=sort_df, dtype=self.dataset_dtype
+            )
+        elif hasattr(df, "to_arrow"):
+            dataset, uids, last_dates, ds = TimeSeriesDataset.from_polars(
+                df=df, static_df=static_df, sort_df=sort_df, dtype=self.dataset_dtype
+            )
+        elif hasattr(df, "schema") and hasattr(df, "column"):
+            dataset, uids, last_dates, ds = TimeSeriesDataset.from_arrow(
+                table=df,
+                static_table=static_df,
+                sort_df=sort_df,
+                dtype=self.dataset_dtype,
+            )
+        else:
+            raise Exception(
+                "`df` must be a pandas DataFrame, a polars DataFrame or a pyarrow Table."
+            )
         return dataset, uids, last_dates, ds
 
+    @property
+    def ds(self):
+        # Dates saved by `save` are read and dates of appended rows are merged
+        # into the stored dates when accessed
+        if self._saved_ds is not None:
+            self._ds = _load_ds(*self._saved_ds, self.uids)
+            self._saved_ds = None
+        if self._appended_ds:
+            ds = self._ds.append(self._appended_ds)
+            series = self.uids.get_indexer(ds.get_level_values("unique_id"))
+            order = np.lexsort((ds.get_level_values("ds"), series))
+            self._ds = ds[order]
+            self._appended_ds = []
+        return self._ds
+
+    @ds.setter
+    def ds(self, ds):
+        self._ds = ds
+        self._saved_ds = None
+        self._appended_ds = []
+
     def fit(
         self,
         df: Optional[pd.DataFrame] = None,
@@ -202,6 +259,7 @@ class NeuralForecast:
         sort_df: bool = True,
         use_init_models: bool = False,
         verbose: bool = False,
+        share_memory: bool = False,
     ):
         """Fit the core.NeuralForecast.
 
@@ -210,10 +268,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, a previously stored dataset is required.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
         val_size : int, optional (default=0)
             Size of validation set.
@@ -223,6 +281,10 @@ class NeuralForecast:
             Use initial model passed when NeuralForecast object was instantiated.
         verbose : bool (default=False)
             Print processing steps.
+        share_memory : bool (default=False)
+            Move the stored dataset to shared memory before fitting, so that the DataLoader
+            workers of models with `num_workers_loader>0` read the same copy of the data,
+            see `TimeSeriesDataset.share_memory`.
 
         Returns
         -------
@@ -254,6 +316,9 @@ class NeuralForecast:
                     "Validation set size is larger than the shorter time-series."
                 )
 
+        if share_memory:
+            self.dataset.share_memory()
+
         # Recover initial model if use_init_models
         if use_init_models:
             self.models = [deepcopy(model) for model in self.models_init]
@@ -265,6 +330,57 @@ class NeuralForecast:
 
         self._fitted = True
 
+    def append(self, df):
+        """Append new observations to the stored dataset.
+
+        Rows are added in place at the end of the stored series, `last_dates` and the
+        stored dates are updated without rebuilding the dataset.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table
+            DataFrame with columns [`unique_id`, `ds`, `y`] and the stored exogenous variables,
+            with dates after the last date of each serie.
+        """
+        if not hasattr(self, "dataset"):
+            raise Exception("You must have a stored dataset to append new rows.")
+        if not isinstance(df, pd.DataFrame):
+            df = df.to_pandas()
+        if df.index.name == "unique_id":
+            df = df.reset_index()
+
+        series = self.uids.get_indexer(df["unique_id"])
+        last_dates = self.last_dates.to_numpy().copy()
+        known = series >= 0
+        if np.any(df["ds"].to_numpy()[known] <= last_dates[series[known]]):
+            raise Exception("Appended rows must be after the last date of their serie.")
+        self.dataset.append(df, uids=self.uids)
+
+        new_last_dates = df["ds"].groupby(series).max()
+        last_dates[new_last_dates.index] = new_last_dates.to_numpy()
+        self.last_dates = pd.Index(last_dates, name=self.last_dates.name)
+        self._appended_ds.append(
+            pd.MultiIndex.from_arrays(
+                [df["unique_id"], df["ds"]], names=["unique_id", "ds"]
+            )
+        )
+
+    def _check_futr_df(self, futr_df, fcsts_df):
+        # Keep the rows of `futr_df` in the forecasting horizon
+        if not isinstance(futr_df, pd.DataFrame):
+            futr_df = futr_df.to_pandas()
+        futr_orig_rows = futr_df.shape[0]
+        futr_df = futr_df.merge(fcsts_df, on=["unique_id", "ds"])
+        base_err_msg = f"`futr_df` must have one row per id and ds in the forecasting horizon ({self.h})."
+        if futr_df.shape[0] < fcsts_df.shape[0]:
+            raise ValueError(base_err_msg)
+        if futr_orig_rows > futr_df.shape[0]:
+            dropped_rows = futr_orig_rows - futr_df.shape[0]
+            warnings.warn(
+                f"Dropped {dropped_rows:,} unused rows from `futr_df`. " + base_err_msg
+            )
+        return futr_df
+
     def predict(
         self,
         df: Optional[pd.DataFrame] = None,
@@ -272,6 +388,8 @@ class NeuralForecast:
         futr_df: Optional[pd.DataFrame] = None,
         sort_df: bool = True,
         verbose: bool = False,
+        engine: str = "lightning",
+        out: Optional[np.ndarray] = None,
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -280,17 +398,23 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If a DataFrame is passed, it is used to generate forecasts.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
-        futr_df : pandas.DataFrame, optional (default=None)
+        futr_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
         sort_df : bool (default=True)
             Sort `df` before fitting.
         verbose : bool (default=False)
             Print processing steps.
+        engine : str (default='lightning')
+            'lightning' predicts with PL's `Trainer`, 'torch' runs the models' `predict_step`
+            in a plain loop, which avoids the trainer's setup latency on each call.
+        out : numpy.ndarray, optional (default=None)
+            Preallocated [h * n_series, n_outputs] array (e.g. a `np.memmap`) where the models
+            write their forecasts batch by batch, the returned forecasts' columns are backed by it.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -306,6 +430,9 @@ class NeuralForecast:
         if not self._fitted:
             raise Exception("You must fit the model before predicting.")
 
+        if engine not in ["lightning", "torch"]:
+            raise ValueError(f"engine must be 'lightning' or 'torch', got {engine!r}")
+
         # Process new dataset but does not store it.
         if df is not None:
             dataset, uids, last_dates, _ = self._prepare_fit(
@@ -334,17 +461,7 @@ class NeuralForecast:
 
         # Update and define new forecasting dataset
         if futr_df is not None:
-            futr_orig_rows = futr_df.shape[0]
-            futr_df = futr_df.merge(fcsts_df, on=["unique_id", "ds"])
-            base_err_msg = f"`futr_df` must have one row per id and ds in the forecasting horizon ({self.h})."
-            if futr_df.shape[0] < fcsts_df.shape[0]:
-                raise ValueError(base_err_msg)
-            if futr_orig_rows > futr_df.shape[0]:
-                dropped_rows = futr_orig_rows - futr_df.shape[0]
-                warnings.warn(
-                    f"Dropped {dropped_rows:,} unused rows from `futr_df`. "
-                    + base_err_msg
-                )
+            futr_df = self._check_futr_df(futr_df=futr_df, fcsts_df=fcsts_df)
             dataset = TimeSeriesDataset.update_dataset(
                 dataset=dataset, future_df=futr_df
             )
@@ -354,16 +471,109 @@ class NeuralForecast:
             )
 
         col_idx = 0
-        fcsts = np.full((self.h * len(uids), len(cols)), fill_value=np.nan)
+        if out is None:
+            fcsts = np.full((self.h * len(uids), len(cols)), fill_value=np.nan)
+        elif out.shape != (self.h * len(uids), len(cols)):
+            raise Exception(
+                f"`out` must have shape {(self.h * len(uids), len(cols))}, got {out.shape}"
+            )
+        else:
+            fcsts = out
         for model in self.models:
             old_test_size = model.get_test_size()
             model.set_test_size(self.h)  # To predict h steps ahead
-            model_fcsts = model.predict(dataset=dataset, **data_kwargs)
+            # Models write their predictions in the memory placeholder
+            output_length = len(model.loss.output_names)
+            model.predict(
+                dataset=dataset,
+                engine=engine,
+                out=fcsts[:, col_idx : col_idx + output_length],
+                **data_kwargs,
+            )
+            col_idx += output_length
+            model.set_test_size(old_test_size)  # Set back to original value
+
+        # Declare predictions pd.DataFrame, without copying the placeholder
+        fcsts = pd.DataFrame(fcsts, columns=cols, index=fcsts_df.index, copy=False)
+        fcsts_df = pd.concat([fcsts_df, fcsts], axis=1, copy=False)
+
+        return fcsts_df
+
+    def predict_last(
+        self, futr_df: Optional[pd.DataFrame] = None, verbose: bool = False
+    ):
+        """Predict from the last window with core.NeuralForecast.
+
+        Serving path of `predict` for the stored dataset, each model forecasts from the
+        last `input_size` observations of each serie only, so that the latency does not
+        depend on the length of the series. New observations are added with `append`.
+        The forecasts are the same as `predict`'s, recurrent models are not supported.
+
+        Parameters
+        ----------
+        futr_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
+            DataFrame with [`unique_id`, `ds`] columns and the stored dataset's future exogenous.
+        verbose : bool (default=False)
+            Print processing steps.
+
+        Returns
+        -------
+        fcsts_df : pandas.DataFrame
+            DataFrame with `models` columns for point predictions and probabilistic
+            predictions for all fitted `models`.
+        """
+        if not hasattr(self, "dataset"):
+            raise Exception("You must have a dataset stored.")
+
+        if not self._fitted:
+            raise Exception("You must fit the model before predicting.")
+
+        dataset = self.dataset
+        if verbose:
+            print("Using stored dataset.")
+
+        cols = []
+        count_names = {"model": 0}
+        for model in self.models:
+            model_name = repr(model)
+            count_names[model_name] = count_names.get(model_name, -1) + 1
+            if count_names[model_name] > 0:
+                model_name += str(count_names[model_name])
+            cols += [model_name + n for n in model.loss.output_names]
+
+        # Placeholder dataframe for predictions with unique_id and ds
+        fcsts_df = _future_dates(
+            dataset=dataset,
+            uids=self.uids,
+            last_dates=self.last_dates,
+            freq=self.freq,
+            h=self.h,
+        )
+
+        # Future rows [n_series, h, C] in the order of the placeholder
+        futr_temporal = None
+        if futr_df is not None:
+            futr_df = self._check_futr_df(futr_df=futr_df, fcsts_df=fcsts_df)
+            futr_df = fcsts_df.reset_index().merge(
+                futr_df, on=["unique_id", "ds"], how="left"
+            )
+            futr_df = futr_df.reindex(columns=dataset.temporal_cols)
+            futr_df["available_mask"] = 1
+            futr_temporal = torch.from_numpy(futr_df.to_numpy(dtype=np.float32))
+            futr_temporal = futr_temporal.to(dataset.temporal.dtype).reshape(
+                len(self.uids), self.h, -1
+            )
+
+        col_idx = 0
+        fcsts = np.full((self.h * len(self.uids), len(cols)), fill_value=np.nan)
+        for model in self.models:
+            model_fcsts = model.predict_last(
+                dataset=dataset, futr_temporal=futr_temporal
+            )
             # Append predictions in memory placeholder
             output_length = len(model.loss.output_names)
             fcsts[:, col_idx : col_idx + output_length] = model_fcsts
             col_idx += output_length
-            model.set_test_size(old_test_size)  # Set back to original value
 
         # Declare predictions pd.DataFrame
         fcsts = pd.DataFrame.from_records(fcsts, columns=cols, index=fcsts_df.index)
@@ -391,10 +601,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, a previously stored dataset is required.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`] and static exogenous.
         n_windows : int (default=1)
             Number of windows used for cross validation.
@@ -417,7 +627,8 @@ class NeuralForecast:
         -------
         fcsts_df : pandas.DataFrame
             DataFrame with insample `models` columns for point predictions and probabilistic
-            predictions for all fitted `models`.
+            predictions for all fitted `models`, and the columns of `df`,
+            only `y` for polars and pyarrow inputs.
         """
         if (df is None) and not (hasattr(self, "dataset")):
             raise Exception("You must pass a DataFrame or have one stored.")
@@ -482,13 +693,14 @@ class NeuralForecast:
 
         for model in self.models:
             model.fit(dataset=self.dataset, val_size=val_size, test_size=test_size)
-            model_fcsts = model.predict(
-                self.dataset, step_size=step_size, **data_kwargs
-            )
-
-            # Append predictions in memory placeholder
+            # Models write their predictions in the memory placeholder
             output_length = len(model.loss.output_names)
-            fcsts[:, col_idx : (col_idx + output_length)] = model_fcsts
+            model.predict(
+                self.dataset,
+                step_size=step_size,
+                out=fcsts[:, col_idx : (col_idx + output_length)],
+                **data_kwargs,
+            )
             col_idx += output_length
 
         self._fitted = True
@@ -498,6 +710,9 @@ class NeuralForecast:
         fcsts_df = pd.concat([fcsts_df, fcsts], axis=1)
 
         # Add original input df's y to forecasts DataFrame
+        if not isinstance(df, pd.DataFrame):
+            # Only the merge columns are converted, in the input's library
+            df = df.select(["unique_id", "ds", "y"]).to_pandas()
         fcsts_df = fcsts_df.merge(df, how="left", on=["unique_id", "ds"])
         return fcsts_df
 
@@ -575,10 +790,13 @@ class NeuralForecast:
             model.set_test_size(test_size=trimmed_dataset.max_size)
 
             # Predict
-            model_fcsts = model.predict(trimmed_dataset, step_size=step_size)
-            # Append predictions in memory placeholder
+            # Models write their predictions in the memory placeholder
             output_length = len(model.loss.output_names)
-            fcsts[:, col_idx : (col_idx + output_length)] = model_fcsts
+            model.predict(
+                trimmed_dataset,
+                step_size=step_size,
+                out=fcsts[:, col_idx : (col_idx + output_length)],
+            )
             col_idx += output_length
             model.set_test_size(test_size=test_size)  # Set original test_size
 
@@ -588,7 +806,7 @@ class NeuralForecast:
 
         # Add original input df's y to forecasts DataFrame
         Y_df = pd.DataFrame.from_records(
-            self.dataset.temporal[:, [0]].numpy(), columns=["y"], index=self.ds
+            self.dataset.temporal[:, [0]].float().numpy(), columns=["y"], index=self.ds
         )
         Y_df = Y_df.reset_index(drop=False)
         fcsts_df = fcsts_df.merge(Y_df, how="left", on=["unique_id", "ds"])
@@ -652,38 +870,56 @@ class NeuralForecast:
 
         # Save dataset
         if (save_dataset) and (hasattr(self, "dataset")):
-            with open(f"{path}/dataset.pkl", "wb") as f:
-                pickle.dump(self.dataset, f)
+            self.dataset.save(f"{path}/dataset")
         elif save_dataset:
             raise Exception(
                 "You need to have a stored dataset to save it, \
                              set `save_dataset=False` to skip saving dataset."
             )
 
-        # Save configuration and parameters
+        # Save configuration and parameters, the indexes are saved as columns
+        files = {}
+        if hasattr(self, "uids"):
+            ds = self.ds
+            files["uids.npy"] = _io.save_index(f"{path}/uids.npy", self.uids)
+            files["last_dates.npy"] = _io.save_index(
+                f"{path}/last_dates.npy", self.last_dates
+            )
+            files["ds.npy"] = _io.save_index(
+                f"{path}/ds.npy", ds.get_level_values("ds")
+            )
+            codes = self.uids.get_indexer(ds.get_level_values("unique_id")).astype(
+                np.int32
+            )
+            files["ds_uids.npy"] = _io.save_array(f"{path}/ds_uids.npy", codes)
         config_dict = {
+            "version": _io.FORMAT_VERSION,
             "h": self.h,
-            "freq": self.freq,
-            "uids": self.uids,
-            "last_dates": self.last_dates,
-            "ds": self.ds,
-            "sort_df": self.sort_df,
+            "freq": self.freq.freqstr,
+            "sort_df": getattr(self, "sort_df", None),
+            "dataset_dtype": str(self.dataset_dtype).replace("torch.", ""),
             "_fitted": self._fitted,
+            "files": files,
         }
 
-        with open(f"{path}/configuration.pkl", "wb") as f:
-            pickle.dump(config_dict, f)
+        with open(f"{path}/configuration.json", "w") as f:
+            json.dump(config_dict, f)
 
     @staticmethod
-    def load(path, verbose=False, **kwargs):
+    def load(path, verbose=False, verify=False, **kwargs):
         """Load NeuralForecast
 
         `core.NeuralForecast`'s method to load checkpoint from path.
+        The stored dataset is memory-mapped and the dates are read when first used,
+        so loading does not depend on the dataset's size.
 
         Parameters
         -----------
         path : str
             Directory to save current status.
+        verify : bool (default=False)
+            Check the saved files' checksums to detect corrupted files, this reads
+            the whole files. Their sizes are always checked.
         kwargs
             Additional keyword arguments to be passed to the function
             `load_from_checkpoint`.
@@ -715,8 +951,13 @@ class NeuralForecast:
 
         if verbose:
             print(10 * "-" + " Loading dataset " + 10 * "-")
-        # Load dataset
-        if "dataset.pkl" in files:
+        # Load dataset, memory-mapped from disk
+        if os.path.isdir(f"{path}/dataset"):
+            dataset = TimeSeriesDataset.load(f"{path}/dataset", verify=verify)
+            if verbose:
+                print("Dataset loaded.")
+        elif "dataset.pkl" in files:
+            # Datasets saved by previous versions
             with open(f"{path}/dataset.pkl", "rb") as f:
                 dataset = pickle.load(f)
             if verbose:
@@ -729,7 +970,23 @@ class NeuralForecast:
         if verbose:
             print(10 * "-" + " Loading configuration " + 10 * "-")
         # Load configuration
-        if "configuration.pkl" in files:
+        if "configuration.json" in files:
+            with open(f"{path}/configuration.json", "r") as f:
+                config_dict = json.load(f)
+            _io.check_files(path, config_dict, verify=verify)
+            config_dict["dataset_dtype"] = getattr(torch, config_dict["dataset_dtype"])
+            if "uids.npy" in config_dict["files"]:
+                saved = config_dict["files"]
+                config_dict["uids"] = _io.load_index(
+                    f"{path}/uids.npy", saved["uids.npy"], name="unique_id"
+                )
+                config_dict["last_dates"] = _io.load_index(
+                    f"{path}/last_dates.npy", saved["last_dates.npy"], name="ds"
+                )
+            if verbose:
+                print("Configuration loaded.")
+        elif "configuration.pkl" in files:
+            # Configurations saved by previous versions
             with open(f"{path}/configuration.pkl", "rb") as f:
                 config_dict = pickle.load(f)
             if verbose:
@@ -738,14 +995,22 @@ class NeuralForecast:
             raise Exception("No configuration found in directory.")
 
         # Create NeuralForecast object
-        neuralforecast = NeuralForecast(models=models, freq=config_dict["freq"])
+        neuralforecast = NeuralForecast(
+            models=models,
+            freq=config_dict["freq"],
+            dataset_dtype=config_dict.get("dataset_dtype", torch.float32),
+        )
 
         # Dataset
         if dataset is not None:
             neuralforecast.dataset = dataset
             neuralforecast.uids = config_dict["uids"]
             neuralforecast.last_dates = config_dict["last_dates"]
-            neuralforecast.ds = config_dict["ds"]
+            if "ds" in config_dict:
+                neuralforecast.ds = config_dict["ds"]
+            else:
+                # Dates are read when first accessed
+                neuralforecast._saved_ds = (path, config_dict["files"]["ds.npy"])
             neuralforecast.sort_df = config_dict["sort_df"]
 
         # Fitted flag
@@ -296,24 +296,24 @@ class DeepAR(BaseWindows):
         if self.val_size == 0:
             return np.nan
 
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="val")
-        n_windows = len(windows["temporal"])
+        # Unfold the windows once, inference batches are gathered from the view
+        unfolded = self._unfold_windows(batch, step="val")
+        n_windows = unfolded["temporal"].shape[0] * unfolded["temporal"].shape[1]
 
-        # Number of windows in batch
-        windows_batch_size = self.inference_windows_batch_size
+        # Validation windows, streamed in chunks of `valid_windows_batch_size`
+        valid_idxs = self._valid_windows(n_windows, batch_idx)
+        windows_batch_size = self.valid_windows_batch_size
         if windows_batch_size < 0:
-            windows_batch_size = n_windows
-        n_batches = int(np.ceil(n_windows / windows_batch_size))
+            windows_batch_size = len(valid_idxs)
+        n_batches = int(np.ceil(len(valid_idxs) / windows_batch_size))
 
-        valid_losses = []
-        batch_sizes = []
+        # Running loss weighted by the number of windows of each chunk
+        valid_loss = 0
+        n_valid = 0
         for i in range(n_batches):
             # Create and normalize windows [Ws, L+H, C]
-            w_idxs = np.arange(
-                i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
-            )
-            windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
+            w_idxs = valid_idxs[i * windows_batch_size : (i + 1) * windows_batch_size]
+            windows = self._sample_windows(unfolded, w_idxs)
             original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, 0])
             windows = self._normalization(windows=windows)
 
@@ -337,18 +337,15 @@ class DeepAR(BaseWindows):
             )
 
             # Model Predictions
-            output_batch = self(windows_batch)
+            output_batch = self._float_output(self(windows_batch))
             # Monte Carlo already returns y_hat with mean and quantiles
             output_batch = output_batch[:, :, 1:]  # Remove mean
             valid_loss_batch = self.valid_loss(
                 y=original_outsample_y, y_hat=output_batch, mask=outsample_mask
             )
-            valid_losses.append(valid_loss_batch)
-            batch_sizes.append(len(output_batch))
-
-        valid_loss = torch.stack(valid_losses)
-        batch_sizes = torch.tensor(batch_sizes).to(valid_loss.device)
-        valid_loss = torch.sum(valid_loss * batch_sizes) / torch.sum(batch_sizes)
+            valid_loss = valid_loss + valid_loss_batch * len(w_idxs)
+            n_valid += len(w_idxs)
+        valid_loss = valid_loss / n_valid
 
         if torch.isnan(valid_loss):
             raise Exception("Loss is NaN, training stopped.")
@@ -360,9 +357,9 @@ class DeepAR(BaseWindows):
     def predict_step(self, batch, batch_idx):
         self.h == self.horizon_backup
 
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="predict")
-        n_windows = len(windows["temporal"])
+        # Unfold the windows once, inference batches are gathered from the view
+        unfolded = self._unfold_windows(batch, step="predict")
+        n_windows = unfolded["temporal"].shape[0] * unfolded["temporal"].shape[1]
 
         # Number of windows in batch
         windows_batch_size = self.inference_windows_batch_size
@@ -376,7 +373,7 @@ class DeepAR(BaseWindows):
             w_idxs = np.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="predict", w_idxs=w_idxs)
+            windows = self._sample_windows(unfolded, w_idxs)
             windows = self._normalization(windows=windows)
 
             # Parse windows
@@ -398,7 +395,7 @@ class DeepAR(BaseWindows):
             )
 
             # Model Predictions
-            y_hat = self(windows_batch)
+            y_hat = self._float_output(self(windows_batch))
             # Monte Carlo already returns y_hat with mean and quantiles
             y_hats.append(y_hat)
         y_hat = torch.cat(y_hats, dim=0)
@@ -468,10 +465,9 @@ class DeepAR(BaseWindows):
         )  # [n_layers, B*trajectory_samples, rnn_hidden_state]
 
         # Scales for inverse normalization
-        y_scale = self.scaler.x_scale[:, 0, temporal_cols.get_indexer(["y"])].squeeze(
-            -1
-        )
-        y_loc = self.scaler.x_shift[:, 0, temporal_cols.get_indexer(["y"])].squeeze(-1)
+        y_idx = self._column_plan(temporal_cols)["y"]
+        y_scale = self.scaler.x_scale[:, 0, y_idx]
+        y_loc = self.scaler.x_shift[:, 0, y_idx]
         y_scale = torch.repeat_interleave(y_scale, self.trajectory_samples, 0)
         y_loc = torch.repeat_interleave(y_loc, self.trajectory_samples, 0)
 
@@ -206,7 +206,9 @@ class HINT:
             random_seed=random_seed,
         )
 
-    def predict(self, dataset, step_size=1, random_seed=None, **data_module_kwargs):
+    def predict(
+        self, dataset, step_size=1, random_seed=None, out=None, **data_module_kwargs
+    ):
         """HINT.predict
 
         After fitting a base model on the entire hierarchical dataset.
@@ -217,6 +219,7 @@ class HINT:
         `dataset`: NeuralForecast's `TimeSeriesDataset` see details [here](https://nixtla.github.io/neuralforecast/tsdataset.html)<br>
         `step_size`: int, steps between sequential predictions, (default 1).<br>
         `random_seed`: int, random seed for the prediction.<br>
+        `out`: np.ndarray=None, preallocated array where the forecasts are written, see the model's `predict`.<br>
         `**data_kwarg`: additional parameters for the dataset module.<br>
 
         **Returns:**<br>
@@ -228,6 +231,7 @@ class HINT:
                 dataset=dataset,
                 step_size=step_size,
                 random_seed=random_seed,
+                out=out,
                 **data_module_kwargs,
             )
             return forecasts
@@ -266,6 +270,9 @@ class HINT:
 
         sample_mean = np.mean(forecasts, axis=-1, keepdims=True)
         forecasts = np.concatenate([sample_mean, forecasts], axis=-1)
+        if out is not None:
+            out[:] = forecasts
+            return out
         return forecasts
 
     def set_test_size(self, test_size):
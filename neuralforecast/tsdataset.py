@@ -1,16 +1,30 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/tsdataset.ipynb.
 
 # %% auto 0
-__all__ = ['TimeSeriesLoader', 'TimeSeriesDataset', 'TimeSeriesDataModule']
+__all__ = ['TimeSeriesLoader', 'TimeSeriesDataset', 'TimeSeriesStreamDataset', 'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
+import json
+import os
+import tempfile
+import weakref
+from collections import deque
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
 import torch
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import (
+    Dataset,
+    DataLoader,
+    IterableDataset,
+    Sampler,
+    get_worker_info,
+)
+
+from .common._io import FORMAT_VERSION, check_files, save_array
 
 # %% ../nbs/tsdataset.ipynb 5
 class TimeSeriesLoader(DataLoader):
@@ -38,6 +52,10 @@ class TimeSeriesLoader(DataLoader):
         DataLoader.__init__(self, dataset=dataset, **kwargs_)
 
     def _collate_fn(self, batch):
+        if isinstance(batch, Mapping):
+            # Already gathered by the dataset's __getitems__
+            return batch
+
         elem = batch[0]
         elem_type = type(elem)
 
@@ -54,20 +72,79 @@ class TimeSeriesLoader(DataLoader):
         elif isinstance(elem, Mapping):
             if elem["static"] is None:
                 return dict(
-                    temporal=self.collate_fn([d["temporal"] for d in batch]),
+                    temporal=self._pad_collate([d["temporal"] for d in batch]),
                     temporal_cols=elem["temporal_cols"],
                 )
 
             return dict(
                 static=self.collate_fn([d["static"] for d in batch]),
                 static_cols=elem["static_cols"],
-                temporal=self.collate_fn([d["temporal"] for d in batch]),
+                temporal=self._pad_collate([d["temporal"] for d in batch]),
                 temporal_cols=elem["temporal_cols"],
             )
 
         raise TypeError(f"Unknown {elem_type}")
 
+    def _pad_collate(self, batch):
+        # Left pad the series only up to the longest one in the batch
+        elem = batch[0]
+        size = (len(batch), elem.shape[0], max(x.shape[-1] for x in batch))
+        if torch.utils.data.get_worker_info() is not None:
+            storage = elem.storage()._new_shared(int(np.prod(size)), device=elem.device)
+            out = elem.new(storage).resize_(*size).zero_()
+        else:
+            out = elem.new_zeros(size)
+        for i, x in enumerate(batch):
+            out[i, :, size[-1] - x.shape[-1] :] = x
+        return out
+
 # %% ../nbs/tsdataset.ipynb 7
+# Shared tensors are stored in memory-mapped files, in memory when possible
+_SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+class _SharedTensor:
+    # Tensor in a memory-mapped file, it is pickled as the path of the file and
+    # every process that loads it maps the same memory. The process that creates
+    # the file owns it and removes it when the handle is released, the mappings
+    # stay valid after that, so a handle can be loaded any number of times while
+    # its owner is alive.
+    def __init__(self, tensor):
+        self.dtype = tensor.dtype
+        self.shape = tuple(tensor.shape)
+        fd, self.path = tempfile.mkstemp(prefix="neuralforecast_", dir=_SHARED_DIR)
+        with os.fdopen(fd, "wb") as f:
+            f.truncate(max(tensor.nbytes, tensor.element_size()))
+        self.tensor = self._map()
+        self.tensor.copy_(tensor)
+        weakref.finalize(self, _SharedTensor._remove, self.path, os.getpid())
+
+    @staticmethod
+    def _remove(path, pid):
+        # forked processes inherit the handle but don't own the file
+        if os.getpid() == pid:
+            os.remove(path)
+
+    def _map(self):
+        numel = int(np.prod(self.shape))
+        tensor = torch.from_file(
+            self.path, shared=True, size=max(numel, 1), dtype=self.dtype
+        )
+        return tensor[:numel].view(self.shape)
+
+    def __getstate__(self):
+        return {"path": self.path, "dtype": self.dtype, "shape": self.shape}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # mapping a missing file would create it
+        if not os.path.exists(self.path):
+            raise Exception(
+                f"The shared memory at {self.path} was released by the dataset that owned it"
+            )
+        self.tensor = self._map()
+
+# %% ../nbs/tsdataset.ipynb 8
 class TimeSeriesDataset(Dataset):
     def __init__(
         self,
@@ -79,14 +156,17 @@ class TimeSeriesDataset(Dataset):
         static=None,
         static_cols=None,
         sorted=False,
+        dtype=torch.float32,
     ):
         super().__init__()
 
-        self.temporal = torch.tensor(temporal, dtype=torch.float)
+        # as_tensor avoids copying tensors of the same dtype, ie. memory-mapped data stays on disk
+        # temporal can be stored in a reduced precision dtype, batches are always float32
+        self.temporal = torch.as_tensor(temporal, dtype=dtype)
         self.temporal_cols = pd.Index(list(temporal_cols))
 
         if static is not None:
-            self.static = torch.tensor(static, dtype=torch.float)
+            self.static = torch.as_tensor(static, dtype=torch.float)
             self.static_cols = static_cols
         else:
             self.static = static
@@ -100,15 +180,117 @@ class TimeSeriesDataset(Dataset):
         # Upadated flag. To protect consistency, dataset can only be updated once
         self.updated = False
         self.sorted = sorted
+        # Shared copies of the tensors, see `share_memory`
+        self._shared = {}
+
+    # After `append` the series are stored with slack in `_buffer`, each serie starts at
+    # `_starts` and holds `_sizes` rows out of its `_capacity`. The packed `temporal`
+    # and `indptr` are only gathered when accessed.
+    @property
+    def temporal(self):
+        if self._temporal is None:
+            sizes = self._sizes
+            indptr = np.append(0, sizes.cumsum())
+            positions = np.arange(indptr[-1]) + np.repeat(
+                self._starts - indptr[:-1], sizes
+            )
+            self._temporal = self._buffer[torch.from_numpy(positions)]
+            self._indptr = indptr.astype(np.int32)
+        return self._temporal
+
+    @temporal.setter
+    def temporal(self, temporal):
+        self._temporal = temporal
+        self._buffer = None
+
+    @property
+    def indptr(self):
+        if self._indptr is None:
+            self.temporal
+        return self._indptr
+
+    @indptr.setter
+    def indptr(self, indptr):
+        self._indptr = indptr
+        self._buffer = None
+
+    def share_memory(self):
+        """Move the dataset's tensors to shared memory, in place.
+
+        The tensors are copied to memory-mapped files, in `/dev/shm` when available,
+        and the dataset is pickled as the paths of the files instead of its data,
+        so that DataLoader workers and other processes (multiprocessing, Ray) use
+        the same physical copy. The files are owned by this dataset and removed
+        with it, pickled copies can only be loaded while it is alive. Appending
+        rows that exceed the series' capacity moves them back to private memory.
+        """
+        for key in ["_temporal", "_buffer", "static"]:
+            tensor = getattr(self, key)
+            handle = self._shared.get(key)
+            if tensor is not None and (handle is None or handle.tensor is not tensor):
+                self._shared[key] = _SharedTensor(tensor)
+                setattr(self, key, self._shared[key].tensor)
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        shared = state.pop("_shared")
+        for key, handle in shared.items():
+            # tensors replaced since `share_memory` are pickled with their data
+            if state[key] is handle.tensor:
+                state[key] = handle
+        return state
+
+    def __setstate__(self, state):
+        # Datasets pickled before the append layout
+        if "temporal" in state:
+            state["_temporal"] = state.pop("temporal")
+            state["_indptr"] = state.pop("indptr")
+            state["_buffer"] = None
+        shared = {
+            key: value
+            for key, value in state.items()
+            if isinstance(value, _SharedTensor)
+        }
+        for key, handle in shared.items():
+            state[key] = handle.tensor
+        state["_shared"] = shared
+        self.__dict__.update(state)
+
+    def _layout(self):
+        # Storage and row range of every serie
+        if self._buffer is None:
+            return self._temporal, self._indptr[:-1], self._indptr[1:]
+        return self._buffer, self._starts, self._starts + self._sizes
+
+    def _reserve(self, new_sizes):
+        # Reallocate with slack proportional to the size of each serie,
+        # so appending rows only rarely moves the stored series
+        storage, starts, ends = self._layout()
+        sizes = ends - starts
+        capacity = sizes + new_sizes
+        capacity = capacity + np.maximum(capacity // 2, 8)
+        new_starts = np.append(0, capacity.cumsum()[:-1])
+
+        buffer = torch.zeros(
+            (int(capacity.sum()), storage.shape[1]), dtype=storage.dtype
+        )
+        offsets = np.repeat(new_starts - starts, sizes)
+        rows = np.arange(sizes.sum()) + np.repeat(
+            starts - np.append(0, sizes.cumsum()[:-1]), sizes
+        )
+        buffer[torch.from_numpy(rows + offsets)] = storage[torch.from_numpy(rows)]
+
+        self._buffer = buffer
+        self._starts = new_starts
+        self._sizes = sizes
+        self._capacity = capacity
 
     def __getitem__(self, idx):
         if isinstance(idx, int):
-            # Parse temporal data and pad its left
-            temporal = torch.zeros(
-                size=(len(self.temporal_cols), self.max_size), dtype=torch.float32
-            )
-            ts = self.temporal[self.indptr[idx] : self.indptr[idx + 1], :]
-            temporal[: len(self.temporal_cols), -len(ts) :] = ts.permute(1, 0)
+            # Parse temporal data, padding is left to the loader's collate
+            storage, starts, ends = self._layout()
+            temporal = storage[starts[idx] : ends[idx], :].permute(1, 0).float()
 
             # Add static data if available
             static = None if self.static is None else self.static[idx, :]
@@ -123,6 +305,116 @@ class TimeSeriesDataset(Dataset):
             return item
         raise ValueError(f"idx must be int, got {type(idx)}")
 
+    def __getitems__(self, idxs):
+        # Gather the whole batch at once, left padded up to its longest serie
+        idxs = np.asarray(idxs)
+        storage, starts, ends = self._layout()
+        starts = starts[idxs]
+        ends = ends[idxs]
+        size = int(np.max(ends - starts))
+        positions = ends[:, None] - size + np.arange(size)
+        padding = torch.from_numpy(positions < starts[:, None])
+
+        # [B, T, C] -> [B, C, T]
+        temporal = storage[torch.from_numpy(np.maximum(positions, 0))]
+        temporal.masked_fill_(padding[:, :, None], 0.0)
+        temporal = temporal.permute(0, 2, 1).float()
+
+        static = None if self.static is None else self.static[torch.from_numpy(idxs)]
+
+        batch = dict(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+
+        return batch
+
+    def last_windows(self, size, h=0, futr_temporal=None):
+        """Batch with the last `size` rows of every serie followed by `h` future rows.
+
+        Only the trailing rows are gathered, so the cost does not depend on the series' length.
+        Series shorter than `size` are left padded with zeros. The future rows are taken from
+        `futr_temporal` [n_series, h, C] in `temporal_cols` order, by default they are missing
+        values with the available mask set, as the rows added by `update_dataset`.
+        """
+        storage, starts, ends = self._layout()
+        positions = ends[:, None] - size + np.arange(size)
+        padding = torch.from_numpy(positions < starts[:, None])
+
+        # [B, L, C] -> [B, L+H, C] -> [B, C, L+H]
+        temporal = storage[torch.from_numpy(np.maximum(positions, 0))]
+        temporal.masked_fill_(padding[:, :, None], 0.0)
+        if h > 0:
+            if futr_temporal is None:
+                futr_temporal = torch.full(
+                    (len(self), h, len(self.temporal_cols)), np.nan
+                )
+                futr_temporal[:, :, self.temporal_cols.get_loc("available_mask")] = 1.0
+            temporal = torch.cat([temporal, futr_temporal.to(temporal.dtype)], dim=1)
+        temporal = temporal.permute(0, 2, 1).float()
+
+        batch = dict(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+            static=self.static,
+            static_cols=self.static_cols,
+        )
+
+        return batch
+
+    def append(self, df, uids):
+        """Append new rows at the end of the dataset's series, in place.
+
+        `df` has the [`unique_id`, `ds`] columns and the dataset's temporal columns,
+        `uids` are the series identifiers in the dataset's order (as returned by `from_df`).
+        Series are kept with slack capacity so that appends only copy the new rows,
+        the series are moved only when one of them runs out of capacity.
+        """
+        if df.index.name == "unique_id":
+            df = df.reset_index()
+        missing_cols = set(self.temporal_cols) - set(df.columns) - {"available_mask"}
+        if len(missing_cols) > 0:
+            raise Exception(
+                f"{missing_cols} temporal variables not found in appended rows"
+            )
+        series = uids.get_indexer(df["unique_id"])
+        if (series < 0).any():
+            raise Exception("Only series already in the dataset can be appended")
+
+        # Sort new rows by serie and date
+        order = np.lexsort((df["ds"].to_numpy(), series))
+        series = series[order]
+        new_sizes = np.bincount(series, minlength=self.n_groups)
+
+        if self._buffer is None or np.any(self._sizes + new_sizes > self._capacity):
+            self._reserve(new_sizes)
+
+        # Rows are written after the last row of each serie
+        first_new = np.repeat(new_sizes.cumsum() - new_sizes, new_sizes)
+        positions = (
+            self._starts[series]
+            + self._sizes[series]
+            + np.arange(len(series))
+            - first_new
+        )
+        positions = torch.from_numpy(positions)
+        for i, col in enumerate(self.temporal_cols):
+            if col == "available_mask" and col not in df.columns:
+                self._buffer[positions, i] = 1.0
+            else:
+                values = df[col].to_numpy(dtype=np.float32)[order]
+                self._buffer[positions, i] = torch.from_numpy(values).to(
+                    self._buffer.dtype
+                )
+
+        self._sizes = self._sizes + new_sizes
+        self._temporal = None
+        self._indptr = None
+        self.max_size = int(self._sizes.max())
+        self.min_size = int(self._sizes.min())
+
     def __len__(self):
         return self.n_groups
 
@@ -138,6 +430,83 @@ class TimeSeriesDataset(Dataset):
             self.indptr, other.indptr
         )
 
+    def save(self, path):
+        """Save the dataset as raw arrays in the `path` directory.
+
+        `temporal`, `indptr` and `static` are written as `.npy` files and the
+        columns, sizes and the files' checksums as `metadata.json`, so that
+        `TimeSeriesDataset.load` can memory-map the arrays instead of deserializing them.
+        """
+        os.makedirs(path, exist_ok=True)
+        temporal = self.temporal
+        if temporal.dtype == torch.bfloat16:
+            # numpy has no bfloat16, its bits are stored as int16
+            temporal = temporal.view(torch.int16)
+        files = {}
+        files["temporal.npy"] = save_array(f"{path}/temporal.npy", temporal.numpy())
+        files["indptr.npy"] = save_array(f"{path}/indptr.npy", np.asarray(self.indptr))
+        if self.static is not None:
+            files["static.npy"] = save_array(f"{path}/static.npy", self.static.numpy())
+        elif os.path.exists(f"{path}/static.npy"):
+            os.remove(f"{path}/static.npy")
+
+        metadata = {
+            "version": FORMAT_VERSION,
+            "temporal_cols": self.temporal_cols.tolist(),
+            "static_cols": None if self.static_cols is None else list(self.static_cols),
+            "max_size": int(self.max_size),
+            "min_size": int(self.min_size),
+            "sorted": bool(self.sorted),
+            "dtype": str(self.temporal.dtype).replace("torch.", ""),
+            "files": files,
+        }
+        with open(f"{path}/metadata.json", "w") as f:
+            json.dump(metadata, f)
+
+    @staticmethod
+    def load(path, mmap=True, verify=False):
+        """Load a dataset saved with `TimeSeriesDataset.save`.
+
+        With `mmap=True` the `temporal` and `static` arrays are memory-mapped
+        copy-on-write, only the series accessed by a batch are read from disk
+        and in-place changes are never written back to `path`.
+        The files' sizes are checked against the saved metadata, with `verify=True`
+        their checksums are also checked, which reads the whole files.
+        """
+        with open(f"{path}/metadata.json", "r") as f:
+            metadata = json.load(f)
+        check_files(path, metadata, verify=verify)
+
+        mmap_mode = "c" if mmap else None
+        temporal = torch.from_numpy(
+            np.load(f"{path}/temporal.npy", mmap_mode=mmap_mode)
+        )
+        dtype = getattr(torch, metadata.get("dtype", "float32"))
+        if dtype == torch.bfloat16:
+            temporal = temporal.view(dtype)
+        indptr = np.load(f"{path}/indptr.npy")
+        if os.path.exists(f"{path}/static.npy"):
+            static = torch.from_numpy(
+                np.load(f"{path}/static.npy", mmap_mode=mmap_mode)
+            )
+            static_cols = pd.Index(metadata["static_cols"])
+        else:
+            static = None
+            static_cols = None
+
+        dataset = TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=metadata["temporal_cols"],
+            indptr=indptr,
+            max_size=metadata["max_size"],
+            min_size=metadata["min_size"],
+            static=static,
+            static_cols=static_cols,
+            sorted=metadata["sorted"],
+            dtype=dtype,
+        )
+        return dataset
+
     @staticmethod
     def update_dataset(dataset, future_df):
         """Add future observations to the dataset."""
@@ -157,44 +526,40 @@ class TimeSeriesDataset(Dataset):
         future_df = future_df[["unique_id", "ds"] + temporal_cols.tolist()]
 
         # Process future_df
-        futr_dataset, *_ = dataset.from_df(df=future_df, sort_df=dataset.sorted)
+        futr_dataset, *_ = dataset.from_df(
+            df=future_df, sort_df=dataset.sorted, dtype=dataset.temporal.dtype
+        )
 
         # Define and fill new temporal with updated information
+        # Each series is shifted by the rows appended to the series before it,
+        # so the new positions follow from indptr arithmetic (no loop over groups)
         len_temporal, col_temporal = dataset.temporal.shape
-        new_temporal = torch.zeros(size=(len_temporal + len(future_df), col_temporal))
-        new_indptr = [0]
-        new_max_size = 0
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = (
-                series_length + futr_dataset.indptr[i + 1] - futr_dataset.indptr[i]
-            )
-            new_temporal[acum : (acum + series_length), :] = dataset.temporal[
-                dataset.indptr[i] : dataset.indptr[i + 1], :
-            ]
-            new_temporal[
-                (acum + series_length) : (acum + new_length), :
-            ] = futr_dataset.temporal[
-                futr_dataset.indptr[i] : futr_dataset.indptr[i + 1], :
-            ]
+        len_futr = len(futr_dataset.temporal)
+        sizes = np.diff(dataset.indptr)
+        futr_sizes = np.diff(futr_dataset.indptr)
+        new_indptr = dataset.indptr + futr_dataset.indptr
+        new_max_size = np.max(sizes + futr_sizes)
 
-            acum += new_length
-            new_indptr.append(acum)
-            if new_length > new_max_size:
-                new_max_size = new_length
+        hist_idxs = np.arange(len_temporal) + np.repeat(futr_dataset.indptr[:-1], sizes)
+        futr_idxs = np.arange(len_futr) + np.repeat(dataset.indptr[1:], futr_sizes)
+
+        new_temporal = torch.zeros(
+            size=(len_temporal + len_futr, col_temporal), dtype=dataset.temporal.dtype
+        )
+        new_temporal[torch.from_numpy(hist_idxs)] = dataset.temporal
+        new_temporal[torch.from_numpy(futr_idxs)] = futr_dataset.temporal
 
         # Define new dataset
         updated_dataset = TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr).astype(np.int32),
+            indptr=new_indptr.astype(np.int32),
             max_size=new_max_size,
             min_size=dataset.min_size,
             static=dataset.static,
             static_cols=dataset.static_cols,
             sorted=dataset.sorted,
+            dtype=dataset.temporal.dtype,
         )
 
         return updated_dataset
@@ -212,20 +577,15 @@ class TimeSeriesDataset(Dataset):
             )
 
         # Define and fill new temporal with trimmed information
-        len_temporal, col_temporal = dataset.temporal.shape
-        total_trim = (left_trim + right_trim) * dataset.n_groups
-        new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
-        new_indptr = [0]
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = series_length - left_trim - right_trim
-            new_temporal[acum : (acum + new_length), :] = dataset.temporal[
-                dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
-            ]
-            acum += new_length
-            new_indptr.append(acum)
+        # Kept rows of each series are gathered in a single indexing operation
+        sizes = np.diff(dataset.indptr)
+        new_sizes = sizes - left_trim - right_trim
+        new_indptr = np.append(0, new_sizes.cumsum())
+        offsets = np.repeat(
+            dataset.indptr[:-1] + left_trim - new_indptr[:-1], new_sizes
+        )
+        idxs = np.arange(new_indptr[-1]) + offsets
+        new_temporal = dataset.temporal[torch.from_numpy(idxs)]
 
         new_max_size = dataset.max_size - left_trim - right_trim
         new_min_size = dataset.min_size - left_trim - right_trim
@@ -234,51 +594,61 @@ class TimeSeriesDataset(Dataset):
         updated_dataset = TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr).astype(np.int32),
+            indptr=new_indptr.astype(np.int32),
             max_size=new_max_size,
             min_size=new_min_size,
             static=dataset.static,
             static_cols=dataset.static_cols,
             sorted=dataset.sorted,
+            dtype=dataset.temporal.dtype,
         )
 
         return updated_dataset
 
     @staticmethod
-    def from_df(df, static_df=None, sort_df=False):
+    def from_df(df, static_df=None, sort_df=False, dtype=torch.float32):
         # TODO: protect on equality of static_df + df indexes
 
-        # Define indexes if not given
+        # Define indexes if not given, only the index is built (df is not copied)
         if df.index.name != "unique_id":
-            df = df.set_index("unique_id")
+            ids = df["unique_id"]
+            temporal_cols = df.columns.drop(["unique_id", "ds"])
             if static_df is not None:
                 static_df = static_df.set_index("unique_id")
-
-        df = df.set_index("ds", append=True)
+        else:
+            ids = df.index
+            temporal_cols = df.columns.drop("ds")
+        index = pd.MultiIndex.from_arrays([ids, df["ds"]], names=["unique_id", "ds"])
 
         # Sort data by index
-        if not df.index.is_monotonic_increasing and sort_df:
-            df = df.sort_index()
+        order = None
+        if not index.is_monotonic_increasing and sort_df:
+            index, order = index.sortlevel([0, 1], sort_remaining=False)
 
             if static_df is not None:
                 static_df = static_df.sort_index()
 
         # Create auxiliary temporal indices 'indptr'
-        temporal = df.values.astype(np.float32)
-        temporal_cols = df.columns
-        indices_sizes = df.index.get_level_values("unique_id").value_counts(sort=False)
+        indices_sizes = index.get_level_values("unique_id").value_counts(sort=False)
         indices = indices_sizes.index
         sizes = indices_sizes.values
         max_size = max(sizes)
         min_size = min(sizes)
         cum_sizes = sizes.cumsum()
-        dates = df.index.get_level_values("ds")[cum_sizes - 1]
+        dates = index.get_level_values("ds")[cum_sizes - 1]
         indptr = np.append(0, cum_sizes).astype(np.int32)
 
-        # Add Available mask efficiently (without adding column to df)
-        if "available_mask" not in df.columns:
-            available_mask = np.ones((len(temporal), 1), dtype=np.float32)
-            temporal = np.append(temporal, available_mask, axis=1)
+        # Allocate the final buffer once and fill it column by column,
+        # the available mask is added without adding a column to df
+        add_mask = "available_mask" not in temporal_cols
+        temporal = torch.empty((len(index), len(temporal_cols) + add_mask), dtype=dtype)
+        for i, col in enumerate(temporal_cols):
+            values = df[col].to_numpy(dtype=np.float32)
+            if order is not None:
+                values = values[order]
+            temporal[:, i] = torch.from_numpy(values)
+        if add_mask:
+            temporal[:, -1] = 1.0
             temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
 
         # Static features
@@ -298,10 +668,444 @@ class TimeSeriesDataset(Dataset):
             max_size=max_size,
             min_size=min_size,
             sorted=sort_df,
+            dtype=dtype,
+        )
+        return dataset, indices, dates, index
+
+    @staticmethod
+    def from_arrow(table, static_table=None, sort_df=False, dtype=torch.float32):
+        """Create a dataset from a `pyarrow.Table` without going through pandas.
+
+        Groups are found with a run-length pass over the sorted `unique_id` column
+        and the data columns are copied once into the `dtype` buffer.
+        Returns the same outputs as `TimeSeriesDataset.from_df`.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        # Decode dictionary (categorical) columns into their values
+        def decode(table):
+            schema = pa.schema(
+                [
+                    f.with_type(f.type.value_type)
+                    if pa.types.is_dictionary(f.type)
+                    else f
+                    for f in table.schema
+                ]
+            )
+            return table.cast(schema)
+
+        table = decode(table)
+        if static_table is not None:
+            static_table = decode(static_table)
+
+        # Sort data by unique_id and ds
+        if sort_df:
+            table = table.sort_by([("unique_id", "ascending"), ("ds", "ascending")])
+            if static_table is not None:
+                static_table = static_table.sort_by([("unique_id", "ascending")])
+
+        # Create auxiliary temporal indices 'indptr' from the runs of unique_id
+        ids = table.column("unique_id")
+        n_rows = len(ids)
+        run_starts = pc.not_equal(ids[1:], ids[:-1]).to_numpy(zero_copy_only=False)
+        starts = np.append(0, np.flatnonzero(run_starts) + 1)
+        indptr = np.append(starts, n_rows).astype(np.int32)
+        sizes = np.diff(indptr)
+        max_size = max(sizes)
+        min_size = min(sizes)
+
+        # Timestamps are casted to pandas' default resolution, keeping their timezone
+        ds = table.column("ds")
+        tz = None
+        if pa.types.is_timestamp(ds.type) or pa.types.is_date(ds.type):
+            tz = getattr(ds.type, "tz", None)
+            ds = pc.cast(ds, pa.timestamp("ns", tz=tz))
+        ds = ds.to_numpy()
+        if tz is not None:
+            # tz-aware timestamps are stored in UTC, as `from_df` the dates are local
+            ds = pd.DatetimeIndex(ds).tz_localize("UTC").tz_convert(tz)
+        indices = pd.Index(
+            ids.take(starts).to_numpy(zero_copy_only=False), name="unique_id"
+        )
+        dates = pd.Index(ds[indptr[1:] - 1], name="ds")
+
+        # Fill data columns and available mask in a single buffer
+        temporal_cols = [
+            col for col in table.column_names if col not in ["unique_id", "ds"]
+        ]
+        add_mask = "available_mask" not in temporal_cols
+        temporal = torch.empty((n_rows, len(temporal_cols) + add_mask), dtype=dtype)
+        for i, col in enumerate(temporal_cols):
+            values = pc.cast(table.column(col), pa.float32()).to_numpy(
+                zero_copy_only=False
+            )
+            temporal[:, i] = torch.from_numpy(np.require(values, requirements="W"))
+        if add_mask:
+            temporal[:, -1] = 1.0
+            temporal_cols = temporal_cols + ["available_mask"]
+
+        # Static features
+        if static_table is not None:
+            static_cols = pd.Index(
+                [col for col in static_table.column_names if col != "unique_id"]
+            )
+            static = np.empty(
+                (static_table.num_rows, len(static_cols)), dtype=np.float32
+            )
+            for i, col in enumerate(static_cols):
+                static[:, i] = pc.cast(static_table.column(col), pa.float32()).to_numpy(
+                    zero_copy_only=False
+                )
+        else:
+            static = None
+            static_cols = None
+
+        dataset = TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=temporal_cols,
+            static=static,
+            static_cols=static_cols,
+            indptr=indptr,
+            max_size=max_size,
+            min_size=min_size,
+            sorted=sort_df,
+            dtype=dtype,
+        )
+        ds = pd.MultiIndex.from_arrays(
+            [np.repeat(indices, sizes), ds], names=["unique_id", "ds"]
+        )
+        return dataset, indices, dates, ds
+
+    @staticmethod
+    def from_polars(df, static_df=None, sort_df=False, dtype=torch.float32):
+        """Create a dataset from a `polars.DataFrame`, see `TimeSeriesDataset.from_arrow`."""
+        static_table = None if static_df is None else static_df.to_arrow()
+        return TimeSeriesDataset.from_arrow(
+            table=df.to_arrow(), static_table=static_table, sort_df=sort_df, dtype=dtype
+        )
+
+# %% ../nbs/tsdataset.ipynb 11
+class TimeSeriesStreamDataset(IterableDataset):
+    """Stream series from a parquet dataset partitioned by `unique_id`.
+
+    Each partition holds one serie, only the partitions' row counts are read
+    when the dataset is created and the series are read when iterated. Every epoch
+    the partitions are shuffled, split between the DataLoader workers and read in
+    background threads, with at most `read_ahead` series in memory per worker.
+    The items are the same as `TimeSeriesDataset`'s, so batches are padded by the
+    loader and the dataset can be used to fit the models.
+    """
+
+    def __init__(self, path, static_df=None, shuffle=True, read_ahead=4):
+        import pyarrow.dataset as pds
+
+        super().__init__()
+        self.path = path
+        self.shuffle = shuffle
+        self.read_ahead = read_ahead
+
+        # Group the files of each partition, the sizes come from the files' metadata
+        dataset = pds.dataset(path, format="parquet", partitioning="hive")
+        files = {}
+        sizes = {}
+        for fragment in dataset.get_fragments():
+            uid = pds.get_partition_keys(fragment.partition_expression)["unique_id"]
+            files.setdefault(uid, []).append(fragment.path)
+            sizes[uid] = sizes.get(uid, 0) + fragment.count_rows()
+        self.uids = sorted(files)
+        self.files = [sorted(files[uid]) for uid in self.uids]
+        sizes = np.array([sizes[uid] for uid in self.uids])
+        self.n_groups = len(self.uids)
+        self.max_size = sizes.max()
+        self.min_size = sizes.min()
+
+        # Data columns, the available mask is added when reading if missing
+        self.data_cols = [
+            col for col in dataset.schema.names if col not in ["unique_id", "ds"]
+        ]
+        temporal_cols = self.data_cols
+        if "available_mask" not in temporal_cols:
+            temporal_cols = temporal_cols + ["available_mask"]
+        self.temporal_cols = pd.Index(temporal_cols)
+
+        # Static features, aligned with the partitions
+        if static_df is not None:
+            static_df = static_df.set_index("unique_id").reindex(self.uids)
+            self.static = torch.tensor(static_df.values, dtype=torch.float)
+            self.static_cols = static_df.columns
+        else:
+            self.static = None
+            self.static_cols = None
+
+    def _read(self, idx):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        table = pa.concat_tables(
+            [
+                pq.read_table(file, columns=["ds"] + self.data_cols)
+                for file in self.files[idx]
+            ]
+        )
+        table = table.sort_by("ds")
+        temporal = torch.ones(
+            (len(self.temporal_cols), table.num_rows), dtype=torch.float
+        )
+        for i, col in enumerate(self.data_cols):
+            values = pc.cast(table.column(col), pa.float32()).to_numpy(
+                zero_copy_only=False
+            )
+            temporal[i] = torch.from_numpy(np.require(values, requirements="W"))
+        static = None if self.static is None else self.static[idx]
+        item = dict(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+        return item
+
+    def __iter__(self):
+        # All the workers draw the same order from the loader's base seed
+        # and read every `num_workers`-th partition of it
+        worker_info = get_worker_info()
+        if worker_info is None:
+            seed = int(torch.empty((), dtype=torch.int64).random_())
+            worker_id, num_workers = 0, 1
+        else:
+            seed = worker_info.seed - worker_info.id
+            worker_id, num_workers = worker_info.id, worker_info.num_workers
+        if self.shuffle:
+            order = np.random.default_rng(seed).permutation(self.n_groups)
+        else:
+            order = np.arange(self.n_groups)
+        order = order[worker_id::num_workers]
+
+        # Bounded read-ahead of the next partitions
+        with ThreadPoolExecutor(max_workers=self.read_ahead) as executor:
+            pending = deque(
+                executor.submit(self._read, idx) for idx in order[: self.read_ahead]
+            )
+            for idx in order[self.read_ahead :]:
+                item = pending.popleft().result()
+                pending.append(executor.submit(self._read, idx))
+                yield item
+            while pending:
+                yield pending.popleft().result()
+
+# %% ../nbs/tsdataset.ipynb 13
+class _BucketBatchSampler(Sampler):
+    """Batch sampler that groups series of similar length.
+
+    Series are shuffled and split in buckets of `bucket_size` batches, each
+    bucket is sorted by length before being split in batches, so that the
+    loader pads every batch close to the length of its own series. The order
+    of the batches is shuffled every epoch.
+    """
+
+    def __init__(self, sizes, batch_size, drop_last=False, bucket_size=100):
+        self.sizes = torch.as_tensor(sizes)
+        self.batch_size = batch_size
+        self.drop_last = drop_last
+        self.bucket_size = bucket_size
+
+    def __iter__(self):
+        idxs = torch.randperm(len(self.sizes))
+        bucket_len = self.batch_size * self.bucket_size
+        batches = []
+        for start in range(0, len(idxs), bucket_len):
+            bucket = idxs[start : start + bucket_len]
+            bucket = bucket[torch.argsort(self.sizes[bucket], stable=True)]
+            batches.extend(bucket.split(self.batch_size))
+        if self.drop_last and len(batches[-1]) < self.batch_size:
+            batches = batches[:-1]
+        for i in torch.randperm(len(batches)):
+            yield batches[i].tolist()
+
+    def __len__(self):
+        if self.drop_last:
+            return len(self.sizes) // self.batch_size
+        return (len(self.sizes) + self.batch_size - 1) // self.batch_size
+
+# %% ../nbs/tsdataset.ipynb 14
+class _ResidentLoader:
+    """Batches of a dataset kept padded in a single `[n_series, C, T]` tensor.
+
+    Each batch is one index op on the resident tensors, without workers,
+    per-item dicts nor collation. The windows are unfolded by the model.
+    """
+
+    def __init__(
+        self,
+        temporal,
+        static,
+        temporal_cols,
+        static_cols,
+        batch_size,
+        shuffle=False,
+        drop_last=False,
+    ):
+        self.temporal = temporal
+        self.static = static
+        self.temporal_cols = temporal_cols
+        self.static_cols = static_cols
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+
+    def __len__(self):
+        n_series = self.temporal.shape[0]
+        if self.drop_last:
+            return n_series // self.batch_size
+        return -(-n_series // self.batch_size)
+
+    def __iter__(self):
+        n_series = self.temporal.shape[0]
+        if self.shuffle:
+            idxs = torch.randperm(n_series)
+        else:
+            idxs = torch.arange(n_series)
+        idxs = idxs.to(self.temporal.device)
+        for i in range(len(self)):
+            idx = idxs[i * self.batch_size : (i + 1) * self.batch_size]
+            static = None if self.static is None else self.static[idx]
+            yield dict(
+                temporal=self.temporal[idx],
+                temporal_cols=self.temporal_cols,
+                static=static,
+                static_cols=self.static_cols,
+            )
+
+# %% ../nbs/tsdataset.ipynb 15
+class _WindowLoader:
+    """Training batches of windows sampled uniformly from the whole dataset.
+
+    The valid `(serie, start)` positions of the windows are indexed once, a window
+    is valid if it has available data both in its input and in its horizon.
+    Each batch samples `windows_batch_size` positions and only gathers their rows,
+    so its cost does not depend on the number or length of the series.
+    """
+
+    def __init__(
+        self,
+        dataset,
+        input_size,
+        h,
+        padding,
+        cutoff,
+        step_size,
+        windows_batch_size,
+        n_batches,
+    ):
+        self.temporal_cols = dataset.temporal_cols
+        self.static_cols = dataset.static_cols
+        self.static = dataset.static
+        self.window_size = input_size + h
+        self.left_padding = padding[0]
+        self.windows_batch_size = windows_batch_size
+        self.n_batches = n_batches
+
+        # Rows of each serie after removing the validation and test sets,
+        # every serie is padded on its own by `padding`
+        indptr = dataset.indptr.astype(np.int64)
+        sizes = np.maximum(np.diff(indptr) - cutoff, 0)
+        padded_sizes = sizes + sum(padding)
+        offsets = np.append(0, padded_sizes.cumsum())
+        rows = np.arange(indptr[-1]) - np.repeat(indptr[:-1], np.diff(indptr))
+        rows = np.flatnonzero(rows < np.repeat(sizes, np.diff(indptr)))
+        positions = (
+            np.repeat(offsets[:-1] + self.left_padding, sizes)
+            + rows
+            - np.repeat(indptr[:-1], sizes)
+        )
+        mask = np.zeros(offsets[-1] + 1, dtype=np.float64)
+        mask_idx = self.temporal_cols.get_loc("available_mask")
+        mask[positions + 1] = (
+            dataset.temporal[torch.from_numpy(rows), mask_idx].double().numpy()
+        )
+        available = mask.cumsum()
+
+        # Start of the windows aligned to the end of each serie
+        n_starts = np.maximum(padded_sizes - self.window_size + 1, 0)
+        series = np.repeat(np.arange(len(sizes)), n_starts)
+        starts = np.arange(n_starts.sum()) - np.repeat(
+            np.append(0, n_starts.cumsum()[:-1]), n_starts
         )
-        return dataset, indices, dates, df.index
+        aligned = (n_starts[series] - 1 - starts) % step_size == 0
+        series, starts = series[aligned], starts[aligned]
+        windows = offsets[series] + starts
+        condition = available[windows + input_size] - available[windows] > 0
+        if h > 0:
+            condition &= (
+                available[windows + self.window_size] - available[windows + input_size]
+                > 0
+            )
+        if not condition.any():
+            raise Exception("No windows available for training")
+        self.index = torch.from_numpy(
+            np.stack([series[condition], starts[condition]], axis=1).astype(np.int32)
+        )
+
+        self.temporal = dataset.temporal
+        self.first_rows = torch.from_numpy(indptr[:-1])
+        self.sizes = torch.from_numpy(sizes)
 
-# %% ../nbs/tsdataset.ipynb 10
+    def __len__(self):
+        return self.n_batches
+
+    def _gather(self, sampled):
+        # [W, L+H, C] rows of the sampled windows, the padding is filled with zeros
+        series, starts = sampled[:, 0].long(), sampled[:, 1].long()
+        steps = starts[:, None] - self.left_padding + torch.arange(self.window_size)
+        padding = (steps < 0) | (steps >= self.sizes[series, None])
+        rows = self.first_rows[series, None] + steps.clamp(min=0)
+        windows = self.temporal[rows.clamp(max=len(self.temporal) - 1)].float()
+        windows.masked_fill_(padding[:, :, None], 0.0)
+
+        static = None if self.static is None else self.static[series]
+        return dict(
+            temporal=windows,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+            sampled=True,
+        )
+
+    def __iter__(self):
+        for _ in range(self.n_batches):
+            yield self._gather(
+                self.index[torch.randint(len(self.index), (self.windows_batch_size,))]
+            )
+
+# %% ../nbs/tsdataset.ipynb 16
+class _PrefetchLoader:
+    """Batches of a loader transformed by `prepare` one step ahead, in a background thread.
+
+    The batches are drawn from the loader in the calling thread, so that its random
+    sampling keeps its order, only `prepare` runs while the current step computes.
+    """
+
+    def __init__(self, loader, prepare, prefetch=1):
+        self.loader = loader
+        self.prepare = prepare
+        self.prefetch = prefetch
+
+    def __len__(self):
+        return len(self.loader)
+
+    def __iter__(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque()
+            for batch in self.loader:
+                pending.append(executor.submit(self.prepare, batch))
+                if len(pending) > self.prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+# %% ../nbs/tsdataset.ipynb 17
 class TimeSeriesDataModule(pl.LightningDataModule):
     def __init__(
         self,
@@ -310,15 +1114,93 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         valid_batch_size=1024,
         num_workers=0,
         drop_last=False,
+        length_bucketing=False,
+        device_resident=False,
+        train_windows=None,
+        prefetch=None,
     ):
         super().__init__()
+        # `train_windows` replaces the training batches of series, which `length_bucketing`
+        # and `device_resident` would build
+        if train_windows is not None and (length_bucketing or device_resident):
+            raise ValueError(
+                "`train_windows` can not be combined with `length_bucketing` or `device_resident`"
+            )
         self.dataset = dataset
         self.batch_size = batch_size
         self.valid_batch_size = valid_batch_size
         self.num_workers = num_workers
         self.drop_last = drop_last
+        self.length_bucketing = length_bucketing
+        self.device_resident = device_resident
+        self.train_windows = train_windows
+        self.prefetch = prefetch
+        self._resident = None
+
+    def _resident_loader(self, batch_size, shuffle=False, drop_last=False):
+        # The padded dataset is built once, on the trainer's device if attached
+        # or in pinned memory for faster copies to the GPU
+        if self._resident is None:
+            batch = self.dataset.__getitems__(np.arange(len(self.dataset)))
+            temporal, static = batch["temporal"], batch["static"]
+            if self.trainer is not None:
+                device = self.trainer.strategy.root_device
+                temporal = temporal.to(device)
+                static = None if static is None else static.to(device)
+            elif torch.cuda.is_available():
+                temporal = temporal.pin_memory()
+                static = None if static is None else static.pin_memory()
+            self._resident = (temporal, static)
+        temporal, static = self._resident
+        return _ResidentLoader(
+            temporal=temporal,
+            static=static,
+            temporal_cols=self.dataset.temporal_cols,
+            static_cols=self.dataset.static_cols,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            drop_last=drop_last,
+        )
 
     def train_dataloader(self):
+        # `prefetch` prepares the next training batch while the current step runs
+        loader = self._train_loader()
+        if self.prefetch is not None:
+            loader = _PrefetchLoader(loader, prepare=self.prefetch)
+        return loader
+
+    def _train_loader(self):
+        if self.train_windows is not None:
+            # Windows sampled from the whole dataset, as many batches as series batches
+            n_series = len(self.dataset)
+            if self.drop_last:
+                n_batches = n_series // self.batch_size
+            else:
+                n_batches = -(-n_series // self.batch_size)
+            return _WindowLoader(
+                self.dataset, n_batches=n_batches, **self.train_windows
+            )
+        if self.device_resident:
+            return self._resident_loader(
+                self.batch_size, shuffle=True, drop_last=self.drop_last
+            )
+        if isinstance(self.dataset, IterableDataset):
+            # Streaming datasets shuffle their partitions themselves
+            return TimeSeriesLoader(
+                self.dataset,
+                batch_size=self.batch_size,
+                num_workers=self.num_workers,
+                drop_last=self.drop_last,
+            )
+        if self.length_bucketing:
+            batch_sampler = _BucketBatchSampler(
+                sizes=np.diff(self.dataset.indptr),
+                batch_size=self.batch_size,
+                drop_last=self.drop_last,
+            )
+            return TimeSeriesLoader(
+                self.dataset, batch_sampler=batch_sampler, num_workers=self.num_workers
+            )
         loader = TimeSeriesLoader(
             self.dataset,
             batch_size=self.batch_size,
@@ -329,6 +1211,10 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         return loader
 
     def val_dataloader(self):
+        if self.device_resident:
+            return self._resident_loader(
+                self.valid_batch_size, drop_last=self.drop_last
+            )
         loader = TimeSeriesLoader(
             self.dataset,
             batch_size=self.valid_batch_size,
@@ -339,6 +1225,8 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         return loader
 
     def predict_dataloader(self):
+        if self.device_resident:
+            return self._resident_loader(self.valid_batch_size)
         loader = TimeSeriesLoader(
             self.dataset,
             batch_size=self.valid_batch_size,